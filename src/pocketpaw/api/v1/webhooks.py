@@ -62,9 +62,8 @@ async def add_webhook(request: Request):
         )
 
     settings = Settings.load()
-    for cfg in settings.webhook_configs:
-        if cfg.get("name") == name:
-            raise HTTPException(status_code=409, detail=f"Webhook '{name}' already exists")
+    if settings.webhook_config(name) is not None:
+        raise HTTPException(status_code=409, detail=f"Webhook '{name}' already exists")
 
     secret = secrets.token_urlsafe(32)
     slot = {
@@ -107,10 +106,10 @@ async def regenerate_webhook_secret(request: Request):
     name = data.get("name", "")
 
     settings = Settings.load()
-    for cfg in settings.webhook_configs:
-        if cfg.get("name") == name:
-            cfg["secret"] = secrets.token_urlsafe(32)
-            settings.save()
-            return {"status": "ok", "secret": cfg["secret"]}
+    cfg = settings.webhook_config(name)
+    if cfg is None:
+        raise HTTPException(status_code=404, detail=f"Webhook '{name}' not found")
 
-    raise HTTPException(status_code=404, detail=f"Webhook '{name}' not found")
+    cfg["secret"] = secrets.token_urlsafe(32)
+    settings.save()
+    return {"status": "ok", "secret": cfg["secret"]}
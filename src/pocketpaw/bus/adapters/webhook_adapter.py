@@ -10,6 +10,8 @@ Created: 2026-02-09
 """
 
 import asyncio
+import hashlib
+import hmac
 import json
 import logging
 from dataclasses import dataclass
@@ -29,6 +31,10 @@ class WebhookSlotConfig:
     description: str = ""
     sync_timeout: int = 30
 
+    def sign(self, body: bytes) -> str:
+        """Return the hex HMAC-SHA256 of *body* under this slot's secret."""
+        return hmac.new(self.secret.encode(), body, hashlib.sha256).hexdigest()
+
 
 class WebhookAdapter(BaseChannelAdapter):
     """Adapter for generic inbound webhooks.
@@ -164,10 +170,12 @@ class WebhookAdapter(BaseChannelAdapter):
         # Wait for the response with timeout
         timeout = slot.sync_timeout
         try:
-            result = await asyncio.wait_for(fut, timeout=timeout)
-            return result
+            async with asyncio.timeout(timeout):
+                return await fut
         except TimeoutError:
-            self._pending.pop(request_id, None)
-            self._buffers.pop(request_id, None)
             _log.warning("Sync webhook timed out after %ds: %s", timeout, request_id)
             return None
+        finally:
+            # send() already pops on success; this covers timeout and cancellation
+            self._pending.pop(request_id, None)
+            self._buffers.pop(request_id, None)
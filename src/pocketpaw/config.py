@@ -627,6 +627,10 @@ class Settings(BaseSettings):
         default=5, description="Max parallel conversations processed simultaneously"
     )
 
+    def webhook_config(self, name: str) -> dict | None:
+        """Return the webhook slot named *name*, or None."""
+        return next((cfg for cfg in self.webhook_configs if cfg.get("name") == name), None)
+
     def save(self) -> None:
         """Save settings to config file.
 
@@ -3,17 +3,18 @@
 Extracted from dashboard.py — contains _start_channel_adapter(),
 _stop_channel_adapter(), and all channel-related REST endpoints:
   - /webhook/whatsapp (GET/POST), /api/whatsapp/qr
-  - /webhook/inbound/{webhook_name}
+  - /webhook/inbound/{webhook_name}, /webhook/inbound/{webhook_name}/batch
   - /api/webhooks, /api/webhooks/add, /api/webhooks/remove, /api/webhooks/regenerate-secret
   - /api/extras/check, /api/extras/install
   - /api/channels/status, /api/channels/save, /api/channels/toggle
 """
 
 import asyncio
+import json
 import logging
 import uuid
 
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
 from pocketpaw.bus import get_message_bus
 from pocketpaw.config import Settings
@@ -241,27 +242,22 @@ async def get_whatsapp_qr():
 # ─── Generic Inbound Webhook API ────────────────────────────────
 
 
-@channels_router.post("/webhook/inbound/{webhook_name}")
-async def webhook_inbound(
-    webhook_name: str,
-    request: Request,
-    wait: bool = Query(False),
-):
-    """Receive an inbound webhook POST.
+# Upper bound on events accepted by one /batch POST
+_WEBHOOK_BATCH_MAX = 100
+
+
+async def _authenticate_webhook(webhook_name: str, request: Request):
+    """Resolve the slot, verify auth, and parse the body of an inbound webhook.
 
     Auth: ``X-Webhook-Secret`` header must match the slot's secret,
     OR ``X-Webhook-Signature: sha256=<hex>`` HMAC-SHA256 of the raw body.
+
+    Returns ``(settings, slot, body)``.
     """
-    import hashlib
     import hmac
 
     settings = Settings.load()
-    slot_dict = None
-    for cfg in settings.webhook_configs:
-        if cfg.get("name") == webhook_name:
-            slot_dict = cfg
-            break
-
+    slot_dict = settings.webhook_config(webhook_name)
     if slot_dict is None:
         raise HTTPException(status_code=404, detail=f"Webhook '{webhook_name}' not found")
 
@@ -283,27 +279,56 @@ async def webhook_inbound(
     if secret_header and hmac.compare_digest(secret_header, slot.secret):
         authed = True
     elif sig_header.startswith("sha256="):
-        expected = hmac.new(slot.secret.encode(), raw_body, hashlib.sha256).hexdigest()
-        if hmac.compare_digest(sig_header[7:], expected):
+        if hmac.compare_digest(sig_header[7:], slot.sign(raw_body)):
             authed = True
 
     if not authed:
         raise HTTPException(status_code=403, detail="Invalid webhook secret or signature")
 
-    # Parse JSON body
+    # Parse JSON from the bytes already read for auth — no second body read
     try:
-        body = await request.json()
+        body = json.loads(raw_body)
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid JSON body")
 
-    # Ensure webhook adapter is running (stateless — auto-start is cheap)
-    if "webhook" not in _channel_adapters:
-        try:
-            await _start_channel_adapter("webhook", settings)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Failed to start webhook adapter: {e}")
+    return settings, slot, body
+
+
+def get_webhook_adapter():
+    """Dependency: the running webhook adapter, or None if not started yet.
+
+    Tests swap the adapter via ``app.dependency_overrides`` instead of
+    mutating ``_channel_adapters``.
+    """
+    return _channel_adapters.get("webhook")
+
+
+async def _ensure_webhook_adapter(adapter, settings: Settings):
+    """Return *adapter*, starting the webhook adapter if it is not running."""
+    if adapter is not None:
+        return adapter
+    # Stateless — auto-start is cheap
+    try:
+        await _start_channel_adapter("webhook", settings)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to start webhook adapter: {e}")
+    return _channel_adapters["webhook"]
+
+
+@channels_router.post("/webhook/inbound/{webhook_name}")
+async def webhook_inbound(
+    webhook_name: str,
+    request: Request,
+    wait: bool = Query(False),
+    adapter=Depends(get_webhook_adapter),
+):
+    """Receive an inbound webhook POST.
 
-    adapter = _channel_adapters["webhook"]
+    Auth: ``X-Webhook-Secret`` header must match the slot's secret,
+    OR ``X-Webhook-Signature: sha256=<hex>`` HMAC-SHA256 of the raw body.
+    """
+    settings, slot, body = await _authenticate_webhook(webhook_name, request)
+    adapter = await _ensure_webhook_adapter(adapter, settings)
     request_id = str(uuid.uuid4())
 
     if not wait:
@@ -317,6 +342,36 @@ async def webhook_inbound(
     return {"status": "ok", "request_id": request_id, "response": response_text}
 
 
+@channels_router.post("/webhook/inbound/{webhook_name}/batch")
+async def webhook_inbound_batch(
+    webhook_name: str,
+    request: Request,
+    adapter=Depends(get_webhook_adapter),
+):
+    """Receive several webhook events in one POST (always async).
+
+    The body is a JSON array of payloads, each in the same format as a single
+    inbound webhook. Auth is checked once against the whole raw body, then
+    every event is handed to the adapter concurrently.
+    """
+    settings, slot, body = await _authenticate_webhook(webhook_name, request)
+    if not isinstance(body, list) or not all(isinstance(item, dict) for item in body):
+        raise HTTPException(status_code=400, detail="Batch body must be a JSON array of objects")
+    if len(body) > _WEBHOOK_BATCH_MAX:
+        raise HTTPException(status_code=400, detail=f"Batch exceeds {_WEBHOOK_BATCH_MAX} events")
+
+    adapter = await _ensure_webhook_adapter(adapter, settings)
+    batch_id = str(uuid.uuid4())
+    request_ids = [f"{batch_id}-{i}" for i in range(len(body))]
+    await asyncio.gather(
+        *(
+            adapter.handle_webhook(slot, item, request_id, sync=False)
+            for item, request_id in zip(body, request_ids, strict=True)
+        )
+    )
+    return {"status": "accepted", "request_ids": request_ids}
+
+
 @channels_router.get("/api/webhooks")
 async def list_webhooks(request: Request):
     """List all configured webhook slots with generated URLs."""
@@ -365,9 +420,8 @@ async def add_webhook(request: Request):
     settings = Settings.load()
 
     # Check for duplicate name
-    for cfg in settings.webhook_configs:
-        if cfg.get("name") == name:
-            raise HTTPException(status_code=409, detail=f"Webhook '{name}' already exists")
+    if settings.webhook_config(name) is not None:
+        raise HTTPException(status_code=409, detail=f"Webhook '{name}' already exists")
 
     secret = secrets.token_urlsafe(32)
     slot = {
@@ -408,13 +462,13 @@ async def regenerate_webhook_secret(request: Request):
     name = data.get("name", "")
 
     settings = Settings.load()
-    for cfg in settings.webhook_configs:
-        if cfg.get("name") == name:
-            cfg["secret"] = secrets.token_urlsafe(32)
-            settings.save()
-            return {"status": "ok", "secret": cfg["secret"]}
+    cfg = settings.webhook_config(name)
+    if cfg is None:
+        raise HTTPException(status_code=404, detail=f"Webhook '{name}' not found")
 
-    raise HTTPException(status_code=404, detail=f"Webhook '{name}' not found")
+    cfg["secret"] = secrets.token_urlsafe(32)
+    settings.save()
+    return {"status": "ok", "secret": cfg["secret"]}
 
 
 # ─── Extras (Optional Dependencies) ─────────────────────────────
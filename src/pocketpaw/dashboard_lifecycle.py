@@ -317,3 +317,11 @@ async def shutdown_event(*, _stop_channel_adapter_fn=None):
         await mcp.stop_all()
     except Exception as e:
         logger.warning("Error stopping MCP servers: %s", e)
+
+    # Close the shared web search HTTP client
+    try:
+        from pocketpaw.tools.builtin.web_search import close_web_search_tool
+
+        await close_web_search_tool()
+    except Exception as e:
+        logger.warning("Error closing web search client: %s", e)
@@ -8,7 +8,7 @@ from typing import Any
 from pocketpaw.config import Settings
 from pocketpaw.llm.router import LLMRouter
 from pocketpaw.tools.builtin.url_extract import UrlExtractTool
-from pocketpaw.tools.builtin.web_search import WebSearchTool
+from pocketpaw.tools.builtin.web_search import get_web_search_tool
 from pocketpaw.tools.protocol import BaseTool
 
 logger = logging.getLogger(__name__)
@@ -77,7 +77,8 @@ class ResearchTool(BaseTool):
 
         try:
             # Step 1: Web Search
-            search_tool = WebSearchTool()
+            # Shared instance: reuses its pooled client and query cache
+            search_tool = get_web_search_tool()
             search_results = await search_tool.execute(query=topic, num_results=num_sources)
 
             if search_results.startswith("Error"):
@@ -1,8 +1,15 @@
 # Web Search tool — search the web via Tavily or Brave APIs.
 # Created: 2026-02-06
 # Part of Phase 1 Quick Wins
+# Updated: 2026-10-17 — Reuse one pooled httpx.AsyncClient across searches, shared via
+#   get_web_search_tool(); cache identical queries for a short TTL; dispatch providers
+#   via _PROVIDERS.
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import httpx
@@ -15,11 +22,44 @@ logger = logging.getLogger(__name__)
 _TAVILY_URL = "https://api.tavily.com/search"
 _BRAVE_URL = "https://api.search.brave.com/res/v1/web/search"
 _PARALLEL_SEARCH_URL = "https://api.parallel.ai/v1beta/search"
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+_CACHE_MAX_ENTRIES = 256
 
 
 class WebSearchTool(BaseTool):
     """Search the web using Tavily, Brave, or Parallel AI Search API."""
 
+    def __init__(
+        self,
+        cache_ttl: int = 300,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._transport = transport  # e.g. httpx.MockTransport in tests
+        # (provider, stripped query, num_results) -> (stored_at, formatted result)
+        self._cache: OrderedDict[tuple[str, str, int], tuple[float, str]] = OrderedDict()
+        self._cache_ttl = cache_ttl  # seconds; 0 disables caching
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        # Kept open between searches so repeat calls reuse pooled connections.
+        # HTTP/2 (h2 comes with the httpx[http2] dependency) lets execute_many()
+        # multiplex over one connection per host.
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=15, limits=_HTTP_LIMITS, http2=True, transport=self._transport
+            )
+        return self._client
+
+    def invalidate(self) -> None:
+        """Drop all cached search results."""
+        self._cache.clear()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+            self._client = None
+
     @property
     def name(self) -> str:
         return "web_search"
@@ -48,6 +88,8 @@ class WebSearchTool(BaseTool):
                 "num_results": {
                     "type": "integer",
                     "description": "Number of results to return (default: 5, max: 10)",
+                    "minimum": 1,
+                    "maximum": 10,
                     "default": 5,
                 },
             },
@@ -57,20 +99,51 @@ class WebSearchTool(BaseTool):
     async def execute(self, query: str, num_results: int = 5) -> str:
         """Execute a web search."""
         settings = get_settings()
+        # The schema advertises 1..10; clamp anyway for direct callers.
         num_results = min(max(num_results, 1), 10)
 
         provider = settings.web_search_provider
+        # The provider gets the same stripped query the cache is keyed on;
+        # case is kept since it can matter (code identifiers, acronyms).
+        query = query.strip()
+
+        key = (provider, query, num_results)
+        cached = self._cache.get(key)
+        if cached is not None:
+            stored_at, result = cached
+            if time.monotonic() - stored_at < self._cache_ttl:
+                self._cache.move_to_end(key)
+                return result
+            del self._cache[key]
 
-        if provider == "tavily":
-            return await self._search_tavily(query, num_results, settings.tavily_api_key)
-        elif provider == "brave":
-            return await self._search_brave(query, num_results, settings.brave_search_api_key)
-        elif provider == "parallel":
-            return await self._search_parallel(query, num_results, settings.parallel_api_key)
-        else:
+        entry = _PROVIDERS.get(provider)
+        if entry is None:
             return self._error(
                 f"Unknown search provider '{provider}'. Use 'tavily', 'brave', or 'parallel'."
             )
+        search, key_field = entry
+        result = await search(self, query, num_results, getattr(settings, key_field))
+
+        # Errors are not cached so a fixed key or a transient outage recovers at once.
+        if self._cache_ttl > 0 and not result.startswith("Error"):
+            self._cache[key] = (time.monotonic(), result)
+            if len(self._cache) > _CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        return result
+
+    async def execute_many(self, queries: list[str], num_results: int = 5) -> list[str]:
+        """Run several searches concurrently over the shared client.
+
+        Results come back in the same order as ``queries``.
+        """
+        results = await asyncio.gather(
+            *(self.execute(query, num_results) for query in queries),
+            return_exceptions=True,
+        )
+        return [
+            self._error(f"Search failed: {r}") if isinstance(r, BaseException) else r
+            for r in results
+        ]
 
     async def _search_tavily(self, query: str, num_results: int, api_key: str | None) -> str:
         if not api_key:
@@ -80,18 +153,18 @@ class WebSearchTool(BaseTool):
             )
 
         try:
-            async with httpx.AsyncClient(timeout=15) as client:
-                resp = await client.post(
-                    _TAVILY_URL,
-                    json={
-                        "api_key": api_key,
-                        "query": query,
-                        "max_results": num_results,
-                        "include_answer": False,
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            client = await self._get_client()
+            resp = await client.post(
+                _TAVILY_URL,
+                json={
+                    "api_key": api_key,
+                    "query": query,
+                    "max_results": num_results,
+                    "include_answer": False,
+                },
+            )
+            resp.raise_for_status()
+            data = resp.json()
 
             results = data.get("results", [])
             if not results:
@@ -112,17 +185,17 @@ class WebSearchTool(BaseTool):
             )
 
         try:
-            async with httpx.AsyncClient(timeout=15) as client:
-                resp = await client.get(
-                    _BRAVE_URL,
-                    params={"q": query, "count": num_results},
-                    headers={
-                        "X-Subscription-Token": api_key,
-                        "Accept": "application/json",
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            client = await self._get_client()
+            resp = await client.get(
+                _BRAVE_URL,
+                params={"q": query, "count": num_results},
+                headers={
+                    "X-Subscription-Token": api_key,
+                    "Accept": "application/json",
+                },
+            )
+            resp.raise_for_status()
+            data = resp.json()
 
             web_results = data.get("web", {}).get("results", [])
             if not web_results:
@@ -152,21 +225,21 @@ class WebSearchTool(BaseTool):
             )
 
         try:
-            async with httpx.AsyncClient(timeout=15) as client:
-                resp = await client.post(
-                    _PARALLEL_SEARCH_URL,
-                    headers={
-                        "x-api-key": api_key,
-                        "parallel-beta": "search-extract-2025-10-10",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "search_queries": [query],
-                        "max_results": num_results,
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            client = await self._get_client()
+            resp = await client.post(
+                _PARALLEL_SEARCH_URL,
+                headers={
+                    "x-api-key": api_key,
+                    "parallel-beta": "search-extract-2025-10-10",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "search_queries": [query],
+                    "max_results": num_results,
+                },
+            )
+            resp.raise_for_status()
+            data = resp.json()
 
             results = data.get("results", [])
             if not results:
@@ -197,3 +270,28 @@ class WebSearchTool(BaseTool):
             snippet = r.get("content", "")[:200]
             lines.append(f"{i}. **{title}**\n   {url}\n   {snippet}\n")
         return "\n".join(lines)
+
+
+# provider -> (search method, Settings field holding its API key)
+_PROVIDERS: dict[str, tuple[Callable[..., Awaitable[str]], str]] = {
+    "tavily": (WebSearchTool._search_tavily, "tavily_api_key"),
+    "brave": (WebSearchTool._search_brave, "brave_search_api_key"),
+    "parallel": (WebSearchTool._search_parallel, "parallel_api_key"),
+}
+
+
+_shared_tool: WebSearchTool | None = None
+
+
+def get_web_search_tool() -> WebSearchTool:
+    """Return a process-wide WebSearchTool so callers share its client and cache."""
+    global _shared_tool
+    if _shared_tool is None:
+        _shared_tool = WebSearchTool()
+    return _shared_tool
+
+
+async def close_web_search_tool() -> None:
+    """Close the shared tool's HTTP client, if one was ever opened."""
+    if _shared_tool is not None:
+        await _shared_tool.close()
@@ -64,8 +64,8 @@ from pocketpaw.tools.builtin import (
     TextToSpeechTool,
     TranslateTool,
     UrlExtractTool,
-    WebSearchTool,
 )
+from pocketpaw.tools.builtin.web_search import close_web_search_tool, get_web_search_tool
 
 # All tools available via CLI (excluding shell/filesystem — those are SDK built-in)
 _TOOLS = {
@@ -85,7 +85,7 @@ _TOOLS = {
         CalendarListTool(),
         CalendarCreateTool(),
         CalendarPrepTool(),
-        WebSearchTool(),
+        get_web_search_tool(),
         UrlExtractTool(),
         ImageGenerateTool(),
         TextToSpeechTool(),
@@ -132,6 +132,14 @@ def _print_tool_list() -> None:
     print("\nUsage: python -m pocketpaw.tools.cli <tool> '<json_args>'")
 
 
+async def _run(tool, args: dict) -> str:
+    """Execute *tool*, then close pooled HTTP clients before the event loop ends."""
+    try:
+        return await tool.execute(**args)
+    finally:
+        await close_web_search_tool()
+
+
 def main() -> None:
     if len(sys.argv) < 2 or sys.argv[1] in ("--help", "-h"):
         _print_tool_list()
@@ -162,7 +170,7 @@ def main() -> None:
         sys.exit(1)
 
     # Execute
-    result = asyncio.run(tool.execute(**args))
+    result = asyncio.run(_run(tool, args))
     print(result)
 
 
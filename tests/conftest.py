@@ -1,11 +1,32 @@
 """Pytest configuration."""
 
-from unittest.mock import patch
+import importlib.util
+import sys
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from pocketpaw.security.audit import AuditLogger
 
+# Optional channel SDKs whose adapters are imported at module level by the
+# adapter tests. Stubbed here, before test modules are collected, but only when
+# the package is not installed: with the real SDK present (e.g. a dev install
+# pulling in pocketpaw[all]) nothing is replaced and every test sees it.
+_OPTIONAL_DEP_STUBS = {
+    "botbuilder": (
+        "botbuilder",
+        "botbuilder.core",
+        "botbuilder.schema",
+        "botbuilder.integration.aiohttp",
+    ),
+    "telegram": ("telegram", "telegram.constants", "telegram.error", "telegram.ext"),
+}
+
+for _package, _modules in _OPTIONAL_DEP_STUBS.items():
+    if importlib.util.find_spec(_package) is None:
+        for _name in _modules:
+            sys.modules.setdefault(_name, MagicMock())
+
 
 @pytest.fixture(autouse=True)
 def _isolate_audit_log(tmp_path):
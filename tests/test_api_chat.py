@@ -57,12 +57,9 @@ class TestChatStream:
         mock_send.return_value = "api:test123"
 
         # Pre-load events into the queue
-        async def _load():
-            await q.put({"event": "chunk", "data": {"content": "Hello "}})
-            await q.put({"event": "chunk", "data": {"content": "world"}})
-            await q.put({"event": "stream_end", "data": {"session_id": "api:test123", "usage": {}}})
-
-        asyncio.get_event_loop().run_until_complete(_load())
+        q.put_nowait({"event": "chunk", "data": {"content": "Hello "}})
+        q.put_nowait({"event": "chunk", "data": {"content": "world"}})
+        q.put_nowait({"event": "stream_end", "data": {"session_id": "api:test123", "usage": {}}})
 
         with client.stream(
             "POST",
@@ -116,14 +113,11 @@ class TestChatSend:
         mock_send.return_value = "api:test"
 
         # Load events
-        async def _load():
-            await q.put({"event": "chunk", "data": {"content": "Hello "}})
-            await q.put({"event": "chunk", "data": {"content": "world!"}})
-            await q.put(
-                {"event": "stream_end", "data": {"session_id": "api:test", "usage": {"tokens": 10}}}
-            )
-
-        asyncio.get_event_loop().run_until_complete(_load())
+        q.put_nowait({"event": "chunk", "data": {"content": "Hello "}})
+        q.put_nowait({"event": "chunk", "data": {"content": "world!"}})
+        q.put_nowait(
+            {"event": "stream_end", "data": {"session_id": "api:test", "usage": {"tokens": 10}}}
+        )
 
         resp = client.post("/api/v1/chat", json={"content": "Hi"})
         assert resp.status_code == 200
@@ -153,13 +147,8 @@ class TestSSEFormat:
         mock_bridge_cls.return_value = bridge
         mock_send.return_value = "api:sse-test"
 
-        async def _load():
-            await q.put({"event": "chunk", "data": {"content": "hi"}})
-            await q.put(
-                {"event": "stream_end", "data": {"session_id": "api:sse-test", "usage": {}}}
-            )
-
-        asyncio.get_event_loop().run_until_complete(_load())
+        q.put_nowait({"event": "chunk", "data": {"content": "hi"}})
+        q.put_nowait({"event": "stream_end", "data": {"session_id": "api:sse-test", "usage": {}}})
 
         with client.stream("POST", "/api/v1/chat/stream", json={"content": "test"}) as resp:
             assert resp.status_code == 200
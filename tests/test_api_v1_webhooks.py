@@ -1,13 +1,21 @@
 # Tests for API v1 webhooks router.
 # Created: 2026-02-21
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from pocketpaw.api.v1.webhooks import router
+from pocketpaw.config import Settings
+
+
+@pytest.fixture(autouse=True)
+def _no_save():
+    """Real Settings objects, but save() is recorded instead of written to disk."""
+    with patch.object(Settings, "save") as save:
+        yield save
 
 
 @pytest.fixture
@@ -27,7 +35,7 @@ class TestListWebhooks:
 
     @patch("pocketpaw.config.Settings.load")
     def test_list_webhooks(self, mock_load, client):
-        mock_s = MagicMock()
+        mock_s = Settings.model_construct()
         mock_s.web_port = 8888
         mock_s.webhook_configs = [
             {"name": "test-hook", "secret": "abcdef12345678", "description": "Test webhook"}
@@ -47,7 +55,7 @@ class TestListWebhooks:
 
     @patch("pocketpaw.config.Settings.load")
     def test_list_empty(self, mock_load, client):
-        mock_s = MagicMock()
+        mock_s = Settings.model_construct()
         mock_s.web_port = 8888
         mock_s.webhook_configs = []
         mock_load.return_value = mock_s
@@ -62,7 +70,7 @@ class TestAddWebhook:
 
     @patch("pocketpaw.config.Settings.load")
     def test_add_webhook(self, mock_load, client):
-        mock_s = MagicMock()
+        mock_s = Settings.model_construct()
         mock_s.webhook_configs = []
         mock_s.webhook_sync_timeout = 30
         mock_load.return_value = mock_s
@@ -88,7 +96,7 @@ class TestAddWebhook:
 
     @patch("pocketpaw.config.Settings.load")
     def test_add_duplicate(self, mock_load, client):
-        mock_s = MagicMock()
+        mock_s = Settings.model_construct()
         mock_s.webhook_configs = [{"name": "existing"}]
         mock_load.return_value = mock_s
 
@@ -104,7 +112,7 @@ class TestRemoveWebhook:
 
     @patch("pocketpaw.config.Settings.load")
     def test_remove_existing(self, mock_load, client):
-        mock_s = MagicMock()
+        mock_s = Settings.model_construct()
         mock_s.webhook_configs = [{"name": "delete-me"}]
         mock_load.return_value = mock_s
 
@@ -114,7 +122,7 @@ class TestRemoveWebhook:
 
     @patch("pocketpaw.config.Settings.load")
     def test_remove_nonexistent(self, mock_load, client):
-        mock_s = MagicMock()
+        mock_s = Settings.model_construct()
         mock_s.webhook_configs = []
         mock_load.return_value = mock_s
 
@@ -127,7 +135,7 @@ class TestRegenerateSecret:
 
     @patch("pocketpaw.config.Settings.load")
     def test_regenerate(self, mock_load, client):
-        mock_s = MagicMock()
+        mock_s = Settings.model_construct()
         old_secret = "old-secret-value"
         mock_s.webhook_configs = [{"name": "my-hook", "secret": old_secret}]
         mock_load.return_value = mock_s
@@ -143,7 +151,7 @@ class TestRegenerateSecret:
 
     @patch("pocketpaw.config.Settings.load")
     def test_regenerate_not_found(self, mock_load, client):
-        mock_s = MagicMock()
+        mock_s = Settings.model_construct()
         mock_s.webhook_configs = []
         mock_load.return_value = mock_s
 
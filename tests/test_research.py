@@ -66,13 +66,16 @@ async def test_research_search_failure():
     tool = ResearchTool()
     mock_search_tool = MagicMock()
     mock_search_tool.execute = AsyncMock(return_value="Error: No API key")
+    mock_search_tool.close = AsyncMock()
     with patch(
-        "pocketpaw.tools.builtin.research.WebSearchTool",
+        "pocketpaw.tools.builtin.research.get_web_search_tool",
         return_value=mock_search_tool,
     ):
         result = await tool.execute(topic="quantum computing")
         assert "Error" in result
         assert "Search failed" in result
+        # The shared search tool outlives the call, keeping its pool and cache
+        mock_search_tool.close.assert_not_awaited()
 
 
 # ---------------------------------------------------------------------------
@@ -97,7 +100,7 @@ async def test_research_happy_path():
 
     with (
         patch(
-            "pocketpaw.tools.builtin.research.WebSearchTool",
+            "pocketpaw.tools.builtin.research.get_web_search_tool",
             return_value=mock_search_tool,
         ),
         patch(
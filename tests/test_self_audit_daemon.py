@@ -1,16 +1,27 @@
 # Tests for daemon/self_audit.py
 # Created: 2026-02-07
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from pocketpaw.daemon.self_audit import (
-    _check_audit_log_size,
-    _check_config_conflicts,
-    _check_disk_usage,
-    _check_orphan_oauth_tokens,
-    _check_stale_sessions,
-    run_self_audit,
-)
+import pytest
+
+_SMALL_AUDIT_BYTES = b"{}\n" * 100
+
+
+@pytest.fixture(scope="session")
+def self_audit():
+    from pocketpaw.daemon import self_audit
+
+    return self_audit
+
+
+@pytest.fixture(autouse=True)
+def _config_dir(tmp_path, monkeypatch):
+    """Point the self-audit checks at the per-test tmp_path."""
+    monkeypatch.setattr("pocketpaw.daemon.self_audit.get_config_dir", lambda: tmp_path)
+    return tmp_path
+
 
 # ---------------------------------------------------------------------------
 # _check_stale_sessions
@@ -18,19 +29,17 @@ from pocketpaw.daemon.self_audit import (
 
 
 class TestStaleSessions:
-    def test_no_sessions_dir(self, tmp_path):
-        with patch("pocketpaw.daemon.self_audit.get_config_dir", return_value=tmp_path):
-            ok, msg = _check_stale_sessions()
-            assert ok is True
-            assert "No sessions" in msg
+    def test_no_sessions_dir(self, self_audit):
+        ok, msg = self_audit._check_stale_sessions()
+        assert ok is True
+        assert "No sessions" in msg
 
-    def test_no_stale_sessions(self, tmp_path):
+    def test_no_stale_sessions(self, self_audit, tmp_path):
         sessions = tmp_path / "memory" / "sessions"
         sessions.mkdir(parents=True)
-        (sessions / "recent.json").write_text("{}")
-        with patch("pocketpaw.daemon.self_audit.get_config_dir", return_value=tmp_path):
-            ok, msg = _check_stale_sessions()
-            assert ok is True
+        (sessions / "recent.json").write_bytes(b"{}")
+        ok, msg = self_audit._check_stale_sessions()
+        assert ok is True
 
 
 # ---------------------------------------------------------------------------
@@ -39,32 +48,32 @@ class TestStaleSessions:
 
 
 class TestConfigConflicts:
-    def test_no_conflicts(self):
+    def test_no_conflicts(self, self_audit):
         mock_settings = MagicMock()
         mock_settings.bypass_permissions = False
         mock_settings.plan_mode = False
         mock_settings.injection_scan_enabled = True
         with patch("pocketpaw.daemon.self_audit.get_settings", return_value=mock_settings):
-            ok, msg = _check_config_conflicts()
+            ok, msg = self_audit._check_config_conflicts()
             assert ok is True
 
-    def test_bypass_with_plan_mode(self):
+    def test_bypass_with_plan_mode(self, self_audit):
         mock_settings = MagicMock()
         mock_settings.bypass_permissions = True
         mock_settings.plan_mode = True
         mock_settings.injection_scan_enabled = True
         with patch("pocketpaw.daemon.self_audit.get_settings", return_value=mock_settings):
-            ok, msg = _check_config_conflicts()
+            ok, msg = self_audit._check_config_conflicts()
             assert ok is False
             assert "bypass_permissions" in msg
 
-    def test_no_safety_net(self):
+    def test_no_safety_net(self, self_audit):
         mock_settings = MagicMock()
         mock_settings.bypass_permissions = False
         mock_settings.plan_mode = False
         mock_settings.injection_scan_enabled = False
         with patch("pocketpaw.daemon.self_audit.get_settings", return_value=mock_settings):
-            ok, msg = _check_config_conflicts()
+            ok, msg = self_audit._check_config_conflicts()
             assert ok is False
             assert "safety net" in msg
 
@@ -75,12 +84,11 @@ class TestConfigConflicts:
 
 
 class TestDiskUsage:
-    def test_small_directory(self, tmp_path):
+    def test_small_directory(self, self_audit, tmp_path):
         (tmp_path / "test.txt").write_text("hello")
-        with patch("pocketpaw.daemon.self_audit.get_config_dir", return_value=tmp_path):
-            ok, msg = _check_disk_usage()
-            assert ok is True
-            assert "MB" in msg
+        ok, msg = self_audit._check_disk_usage()
+        assert ok is True
+        assert "MB" in msg
 
 
 # ---------------------------------------------------------------------------
@@ -89,16 +97,14 @@ class TestDiskUsage:
 
 
 class TestAuditLogSize:
-    def test_no_audit_log(self, tmp_path):
-        with patch("pocketpaw.daemon.self_audit.get_config_dir", return_value=tmp_path):
-            ok, msg = _check_audit_log_size()
-            assert ok is True
+    def test_no_audit_log(self, self_audit):
+        ok, msg = self_audit._check_audit_log_size()
+        assert ok is True
 
-    def test_small_audit_log(self, tmp_path):
-        (tmp_path / "audit.jsonl").write_text("{}\n" * 100)
-        with patch("pocketpaw.daemon.self_audit.get_config_dir", return_value=tmp_path):
-            ok, msg = _check_audit_log_size()
-            assert ok is True
+    def test_small_audit_log(self, self_audit, tmp_path):
+        (tmp_path / "audit.jsonl").write_bytes(_SMALL_AUDIT_BYTES)
+        ok, msg = self_audit._check_audit_log_size()
+        assert ok is True
 
 
 # ---------------------------------------------------------------------------
@@ -107,19 +113,17 @@ class TestAuditLogSize:
 
 
 class TestOAuthTokens:
-    def test_no_oauth_dir(self, tmp_path):
-        with patch("pocketpaw.daemon.self_audit.get_config_dir", return_value=tmp_path):
-            ok, msg = _check_orphan_oauth_tokens()
-            assert ok is True
+    def test_no_oauth_dir(self, self_audit):
+        ok, msg = self_audit._check_orphan_oauth_tokens()
+        assert ok is True
 
-    def test_with_tokens(self, tmp_path):
+    def test_with_tokens(self, self_audit, tmp_path):
         oauth_dir = tmp_path / "oauth"
         oauth_dir.mkdir()
-        (oauth_dir / "google_gmail.json").write_text("{}")
-        with patch("pocketpaw.daemon.self_audit.get_config_dir", return_value=tmp_path):
-            ok, msg = _check_orphan_oauth_tokens()
-            assert ok is True
-            assert "1 OAuth" in msg
+        (oauth_dir / "google_gmail.json").write_bytes(b"{}")
+        ok, msg = self_audit._check_orphan_oauth_tokens()
+        assert ok is True
+        assert "1 OAuth" in msg
 
 
 # ---------------------------------------------------------------------------
@@ -127,20 +131,21 @@ class TestOAuthTokens:
 # ---------------------------------------------------------------------------
 
 
-async def test_run_self_audit(tmp_path):
+async def test_run_self_audit(self_audit, tmp_path):
     """Full audit should run without crashing."""
-    mock_settings = MagicMock()
-    mock_settings.bypass_permissions = False
-    mock_settings.plan_mode = False
-    mock_settings.injection_scan_enabled = True
-    mock_settings.tool_profile = "coding"
-    mock_settings.anthropic_api_key = "test-key"
-    mock_settings.file_jail_path = tmp_path
+    mock_settings = SimpleNamespace(
+        bypass_permissions=False,
+        plan_mode=False,
+        injection_scan_enabled=True,
+        tool_profile="coding",
+        anthropic_api_key="test-key",
+        file_jail_path=tmp_path,
+    )
 
     config_dir = tmp_path / ".pocketpaw"
     config_dir.mkdir()
-    (config_dir / "config.json").write_text("{}")
-    (config_dir / "audit.jsonl").write_text("")
+    (config_dir / "config.json").write_bytes(b"{}")
+    (config_dir / "audit.jsonl").write_bytes(b"")
 
     with (
         patch("pocketpaw.daemon.self_audit.get_config_dir", return_value=config_dir),
@@ -152,7 +157,7 @@ async def test_run_self_audit(tmp_path):
         ),
         patch("pocketpaw.security.audit_cli.get_settings", return_value=mock_settings),
     ):
-        report = await run_self_audit()
+        report = await self_audit.run_self_audit()
         assert "total_checks" in report
         assert "results" in report
         assert report["total_checks"] > 0
@@ -2,28 +2,60 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
 from pocketpaw.bus.adapters.signal_adapter import SignalAdapter
 from pocketpaw.bus.events import Channel, OutboundMessage
 
 
+class _Resp:
+    status_code = 200
+
+
+class _HttpRecorder:
+    """Minimal stand-in for httpx.AsyncClient that records POST calls."""
+
+    def __init__(self):
+        self.posts = []
+
+    async def post(self, url, *, json=None, **kwargs):
+        self.posts.append({"url": url, "json": json, **kwargs})
+        return _Resp()
+
+
 class TestSignalAdapterInit:
-    def test_defaults(self):
-        adapter = SignalAdapter()
-        assert adapter.api_url == "http://localhost:8080"
-        assert adapter.phone_number == ""
-        assert adapter.allowed_phone_numbers == []
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            (
+                {},
+                {
+                    "api_url": "http://localhost:8080",
+                    "phone_number": "",
+                    "allowed_phone_numbers": [],
+                },
+            ),
+            (
+                {
+                    "api_url": "http://signal:9090/",
+                    "phone_number": "+1234567890",
+                    "allowed_phone_numbers": ["+1111111111"],
+                },
+                {
+                    "api_url": "http://signal:9090",
+                    "phone_number": "+1234567890",
+                    "allowed_phone_numbers": ["+1111111111"],
+                },
+            ),
+        ],
+        ids=["defaults", "custom_config"],
+    )
+    def test_init(self, kwargs, expected):
+        adapter = SignalAdapter(**kwargs)
+        for attr, value in expected.items():
+            assert getattr(adapter, attr) == value
         assert adapter.channel == Channel.SIGNAL
 
-    def test_custom_config(self):
-        adapter = SignalAdapter(
-            api_url="http://signal:9090/",
-            phone_number="+1234567890",
-            allowed_phone_numbers=["+1111111111"],
-        )
-        assert adapter.api_url == "http://signal:9090"
-        assert adapter.phone_number == "+1234567890"
-        assert adapter.allowed_phone_numbers == ["+1111111111"]
-
 
 class TestSignalAdapterStartStop:
     async def test_start_sets_running(self):
@@ -125,75 +157,57 @@ class TestSignalAdapterHandleMessage:
 
 
 class TestSignalAdapterSend:
+    # send() only reads these, so they are safe to share between tests.
+    _SEND_MSG = OutboundMessage(channel=Channel.SIGNAL, chat_id="+9876543210", content="Hello!")
+    _EMPTY_MSG = OutboundMessage(channel=Channel.SIGNAL, chat_id="+111", content="   ")
+
     async def test_send_normal_message(self):
         adapter = SignalAdapter(phone_number="+1234567890")
-        adapter._http = AsyncMock()
-        adapter._http.post = AsyncMock(return_value=MagicMock(status_code=200))
+        adapter._http = _HttpRecorder()
 
-        msg = OutboundMessage(
-            channel=Channel.SIGNAL,
-            chat_id="+9876543210",
-            content="Hello!",
-        )
-        await adapter.send(msg)
+        await adapter.send(self._SEND_MSG)
 
-        adapter._http.post.assert_called_once()
-        call_kwargs = adapter._http.post.call_args
-        assert call_kwargs[1]["json"]["message"] == "Hello!"
-        assert call_kwargs[1]["json"]["recipients"] == ["+9876543210"]
+        assert len(adapter._http.posts) == 1
+        payload = adapter._http.posts[0]["json"]
+        assert payload["message"] == "Hello!"
+        assert payload["recipients"] == ["+9876543210"]
 
     async def test_send_stream_chunks(self):
         adapter = SignalAdapter(phone_number="+1234567890")
-        adapter._http = AsyncMock()
-        adapter._http.post = AsyncMock(return_value=MagicMock(status_code=200))
+        adapter._http = _HttpRecorder()
 
         # Send stream chunks
-        chunk1 = OutboundMessage(
-            channel=Channel.SIGNAL,
-            chat_id="+111",
-            content="Hello ",
-            is_stream_chunk=True,
-        )
-        chunk2 = OutboundMessage(
-            channel=Channel.SIGNAL,
-            chat_id="+111",
-            content="World!",
-            is_stream_chunk=True,
+        for content in ("Hello ", "World!"):
+            await adapter.send(
+                OutboundMessage(
+                    channel=Channel.SIGNAL,
+                    chat_id="+111",
+                    content=content,
+                    is_stream_chunk=True,
+                )
+            )
+        assert adapter._http.posts == []  # buffered
+
+        await adapter.send(
+            OutboundMessage(
+                channel=Channel.SIGNAL,
+                chat_id="+111",
+                content="",
+                is_stream_end=True,
+            )
         )
-        end = OutboundMessage(
-            channel=Channel.SIGNAL,
-            chat_id="+111",
-            content="",
-            is_stream_end=True,
-        )
-
-        await adapter.send(chunk1)
-        await adapter.send(chunk2)
-        adapter._http.post.assert_not_called()  # buffered
-
-        await adapter.send(end)
-        adapter._http.post.assert_called_once()
-        assert "Hello World!" in adapter._http.post.call_args[1]["json"]["message"]
+        assert len(adapter._http.posts) == 1
+        assert "Hello World!" in adapter._http.posts[0]["json"]["message"]
 
     async def test_send_empty_message_skipped(self):
         adapter = SignalAdapter(phone_number="+1234567890")
         adapter._http = AsyncMock()
         adapter._http.post = AsyncMock()
 
-        msg = OutboundMessage(
-            channel=Channel.SIGNAL,
-            chat_id="+111",
-            content="   ",
-        )
-        await adapter.send(msg)
+        await adapter.send(self._EMPTY_MSG)
         adapter._http.post.assert_not_called()
 
     async def test_send_without_http_client(self):
         adapter = SignalAdapter(phone_number="+1234567890")
         # _http is None
-        msg = OutboundMessage(
-            channel=Channel.SIGNAL,
-            chat_id="+111",
-            content="test",
-        )
-        await adapter.send(msg)  # should not raise
+        await adapter.send(self._SEND_MSG)  # should not raise
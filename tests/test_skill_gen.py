@@ -3,15 +3,18 @@
 
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
 
 import pytest
 
-from pocketpaw.tools.builtin.skill_gen import _VALID_SKILL_NAME, CreateSkillTool
+from pocketpaw.tools.builtin.skill_gen import _VALID_SKILL_NAME
+
+_match_skill_name = _VALID_SKILL_NAME.match
 
 
 @pytest.fixture
 def tool():
+    from pocketpaw.tools.builtin.skill_gen import CreateSkillTool
+
     return CreateSkillTool()
 
 
@@ -21,6 +24,19 @@ def temp_skills_dir():
         yield Path(tmpdir)
 
 
+@pytest.fixture
+def skills_dir(monkeypatch, temp_skills_dir):
+    """Redirect CreateSkillTool to the temp skills directory."""
+    monkeypatch.setattr(
+        "pocketpaw.tools.builtin.skill_gen._get_skills_dir", lambda: temp_skills_dir
+    )
+    return temp_skills_dir
+
+
+def _raise_import_error():
+    raise ImportError
+
+
 class TestCreateSkillTool:
     """Tests for CreateSkillTool."""
 
@@ -38,74 +54,73 @@ class TestCreateSkillTool:
         assert "allowed_tools" in params["properties"]
         assert "user_invocable" in params["properties"]
 
-    def test_valid_skill_names(self):
-        assert _VALID_SKILL_NAME.match("my-skill")
-        assert _VALID_SKILL_NAME.match("summarize_pr")
-        assert _VALID_SKILL_NAME.match("a")
-        assert _VALID_SKILL_NAME.match("test123")
-
-    def test_invalid_skill_names(self):
-        assert not _VALID_SKILL_NAME.match("")
-        assert not _VALID_SKILL_NAME.match("My-Skill")  # uppercase
-        assert not _VALID_SKILL_NAME.match("123start")  # starts with number
-        assert not _VALID_SKILL_NAME.match("has space")
-        assert not _VALID_SKILL_NAME.match("-starts-with-dash")
-
-    @patch("pocketpaw.tools.builtin.skill_gen._get_skills_dir")
-    async def test_create_skill_success(self, mock_dir, tool, temp_skills_dir):
-        mock_dir.return_value = temp_skills_dir
-
-        with patch("pocketpaw.skills.get_skill_loader", side_effect=ImportError):
-            result = await tool.execute(
-                skill_name="test-skill",
-                description="A test skill",
-                instructions="Do the thing.\nStep 1.\nStep 2.",
-            )
+    @pytest.mark.parametrize(
+        ("name", "ok"),
+        [
+            ("my-skill", True),
+            ("summarize_pr", True),
+            ("a", True),
+            ("test123", True),
+            ("", False),
+            ("My-Skill", False),  # uppercase
+            ("123start", False),  # starts with number
+            ("has space", False),
+            ("-starts-with-dash", False),
+        ],
+    )
+    def test_skill_name_regex(self, name, ok):
+        assert bool(_match_skill_name(name)) is ok
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            pytest.param(
+                {
+                    "skill_name": "test-skill",
+                    "description": "A test skill",
+                    "instructions": "Do the thing.\nStep 1.\nStep 2.",
+                },
+                (
+                    "---",
+                    "name: test-skill",
+                    "description: A test skill",
+                    "user-invocable: true",
+                    "Do the thing.",
+                ),
+                id="success",
+            ),
+            pytest.param(
+                {
+                    "skill_name": "code-review",
+                    "description": "Review code",
+                    "instructions": "Review the code changes.",
+                    "allowed_tools": ["read_file", "shell"],
+                },
+                ("allowed-tools:", "  - read_file", "  - shell"),
+                id="with_allowed_tools",
+            ),
+            pytest.param(
+                {
+                    "skill_name": "internal-skill",
+                    "description": "Internal only",
+                    "instructions": "Do internal stuff.",
+                    "user_invocable": False,
+                },
+                ("user-invocable: false",),
+                id="not_user_invocable",
+            ),
+        ],
+    )
+    async def test_create_skill(self, tool, skills_dir, monkeypatch, kwargs, expected):
+        monkeypatch.setattr("pocketpaw.skills.get_skill_loader", _raise_import_error)
+        result = await tool.execute(**kwargs)
 
         assert "created successfully" in result
-        skill_file = temp_skills_dir / "test-skill" / "SKILL.md"
-        assert skill_file.exists()
-
+        # read_text() fails loudly if the file wasn't written.
+        skill_file = skills_dir / kwargs["skill_name"] / "SKILL.md"
         content = skill_file.read_text(encoding="utf-8")
-        assert "---" in content
-        assert "name: test-skill" in content
-        assert "description: A test skill" in content
-        assert "user-invocable: true" in content
-        assert "Do the thing." in content
-
-    @patch("pocketpaw.tools.builtin.skill_gen._get_skills_dir")
-    async def test_create_skill_with_allowed_tools(self, mock_dir, tool, temp_skills_dir):
-        mock_dir.return_value = temp_skills_dir
-
-        with patch("pocketpaw.skills.get_skill_loader", side_effect=ImportError):
-            result = await tool.execute(
-                skill_name="code-review",
-                description="Review code",
-                instructions="Review the code changes.",
-                allowed_tools=["read_file", "shell"],
-            )
-
-        assert "created successfully" in result
-        content = (temp_skills_dir / "code-review" / "SKILL.md").read_text(encoding="utf-8")
-        assert "allowed-tools:" in content
-        assert "  - read_file" in content
-        assert "  - shell" in content
-
-    @patch("pocketpaw.tools.builtin.skill_gen._get_skills_dir")
-    async def test_create_skill_not_user_invocable(self, mock_dir, tool, temp_skills_dir):
-        mock_dir.return_value = temp_skills_dir
-
-        with patch("pocketpaw.skills.get_skill_loader", side_effect=ImportError):
-            result = await tool.execute(
-                skill_name="internal-skill",
-                description="Internal only",
-                instructions="Do internal stuff.",
-                user_invocable=False,
-            )
-
-        assert "created successfully" in result
-        content = (temp_skills_dir / "internal-skill" / "SKILL.md").read_text(encoding="utf-8")
-        assert "user-invocable: false" in content
+        for needle in expected:
+            assert needle in content
 
     async def test_invalid_skill_name_rejected(self, tool):
         result = await tool.execute(
@@ -116,14 +131,11 @@ class TestCreateSkillTool:
         assert "Error" in result
         assert "Invalid skill name" in result
 
-    @patch("pocketpaw.tools.builtin.skill_gen._get_skills_dir")
-    async def test_overwrite_protection(self, mock_dir, tool, temp_skills_dir):
-        mock_dir.return_value = temp_skills_dir
-
+    async def test_overwrite_protection(self, tool, skills_dir):
         # Pre-create the skill
-        skill_dir = temp_skills_dir / "existing-skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("existing content")
+        skill_file = skills_dir / "existing-skill" / "SKILL.md"
+        skill_file.parent.mkdir()
+        skill_file.write_text("existing content")
 
         result = await tool.execute(
             skill_name="existing-skill",
@@ -134,34 +146,34 @@ class TestCreateSkillTool:
         assert "Error" in result
         assert "already exists" in result
         # Original content preserved
-        assert (skill_dir / "SKILL.md").read_text(encoding="utf-8") == "existing content"
-
-    @patch("pocketpaw.tools.builtin.skill_gen._get_skills_dir")
-    async def test_skill_loader_reload_called(self, mock_dir, tool, temp_skills_dir):
-        mock_dir.return_value = temp_skills_dir
-
-        mock_loader = MagicMock()
-        with patch("pocketpaw.skills.get_skill_loader", return_value=mock_loader):
-            await tool.execute(
-                skill_name="reloaded-skill",
-                description="Test reload",
-                instructions="Content.",
-            )
-
-        mock_loader.reload.assert_called_once()
-
-    @patch("pocketpaw.tools.builtin.skill_gen._get_skills_dir")
-    async def test_yaml_frontmatter_format(self, mock_dir, tool, temp_skills_dir):
-        mock_dir.return_value = temp_skills_dir
-
-        with patch("pocketpaw.skills.get_skill_loader", side_effect=ImportError):
-            await tool.execute(
-                skill_name="fmt-test",
-                description="Format test",
-                instructions="Instruction body here.",
-            )
-
-        content = (temp_skills_dir / "fmt-test" / "SKILL.md").read_text(encoding="utf-8")
-        # Check frontmatter delimiters
-        parts = content.split("---")
-        assert len(parts) >= 3  # before, frontmatter, after
+        assert skill_file.read_text(encoding="utf-8") == "existing content"
+
+    async def test_skill_loader_reload_called(self, tool, skills_dir, monkeypatch):
+        class _LoaderSpy:
+            reloads = 0
+
+            def reload(self):
+                self.reloads += 1
+
+        loader = _LoaderSpy()
+        monkeypatch.setattr("pocketpaw.skills.get_skill_loader", lambda: loader)
+        await tool.execute(
+            skill_name="reloaded-skill",
+            description="Test reload",
+            instructions="Content.",
+        )
+
+        assert loader.reloads == 1
+
+    async def test_yaml_frontmatter_format(self, tool, skills_dir, monkeypatch):
+        monkeypatch.setattr("pocketpaw.skills.get_skill_loader", _raise_import_error)
+        await tool.execute(
+            skill_name="fmt-test",
+            description="Format test",
+            instructions="Instruction body here.",
+        )
+
+        content = (skills_dir / "fmt-test" / "SKILL.md").read_text(encoding="utf-8")
+        # Opening delimiter first, closing delimiter somewhere after it
+        assert content.startswith("---")
+        assert content.find("---", 3) != -1
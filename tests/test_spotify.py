@@ -2,107 +2,105 @@
 
 from unittest.mock import AsyncMock, patch
 
+import pytest
 
-class TestSpotifyToolSchemas:
-    """Test Spotify tool properties and schemas."""
+from pocketpaw.tools.builtin.spotify import (
+    SpotifyNowPlayingTool,
+    SpotifyPlaybackTool,
+    SpotifyPlaylistTool,
+    SpotifySearchTool,
+)
 
-    def test_search_tool(self):
-        from pocketpaw.tools.builtin.spotify import SpotifySearchTool
 
-        tool = SpotifySearchTool()
-        assert tool.name == "spotify_search"
-        assert tool.trust_level == "standard"
-        assert "query" in tool.parameters["properties"]
+# The Spotify tools hold no per-instance state, so one instance per module
+# is shared by the schema and execute tests.
+@pytest.fixture(scope="module")
+def search_tool():
+    return SpotifySearchTool()
 
-    def test_now_playing_tool(self):
-        from pocketpaw.tools.builtin.spotify import SpotifyNowPlayingTool
 
-        tool = SpotifyNowPlayingTool()
-        assert tool.name == "spotify_now_playing"
-        assert tool.trust_level == "standard"
+@pytest.fixture(scope="module")
+def now_playing_tool():
+    return SpotifyNowPlayingTool()
 
-    def test_playback_tool(self):
-        from pocketpaw.tools.builtin.spotify import SpotifyPlaybackTool
 
-        tool = SpotifyPlaybackTool()
-        assert tool.name == "spotify_playback"
-        assert "action" in tool.parameters["properties"]
-        assert "action" in tool.parameters["required"]
+@pytest.fixture(scope="module")
+def playback_tool():
+    return SpotifyPlaybackTool()
 
-    def test_playlist_tool(self):
-        from pocketpaw.tools.builtin.spotify import SpotifyPlaylistTool
 
-        tool = SpotifyPlaylistTool()
-        assert tool.name == "spotify_playlist"
-        assert "action" in tool.parameters["properties"]
+@pytest.fixture(scope="module")
+def playlist_tool():
+    return SpotifyPlaylistTool()
 
 
-async def test_spotify_search_no_auth():
-    from pocketpaw.tools.builtin.spotify import SpotifySearchTool
+@pytest.fixture
+def no_auth(monkeypatch):
+    """Make every SpotifyClient token lookup fail as if the user never logged in."""
 
-    tool = SpotifySearchTool()
-    with patch(
-        "pocketpaw.integrations.spotify.SpotifyClient._get_token",
-        side_effect=RuntimeError("Not authenticated"),
-    ):
-        result = await tool.execute(query="bohemian rhapsody")
-    assert result.startswith("Error:")
-    assert "authenticated" in result.lower()
+    async def _raise(*args, **kwargs):
+        raise RuntimeError("Not authenticated")
 
+    monkeypatch.setattr("pocketpaw.integrations.spotify.SpotifyClient._get_token", _raise)
 
-async def test_spotify_now_playing_no_auth():
-    from pocketpaw.tools.builtin.spotify import SpotifyNowPlayingTool
 
-    tool = SpotifyNowPlayingTool()
-    with patch(
-        "pocketpaw.integrations.spotify.SpotifyClient._get_token",
-        side_effect=RuntimeError("Not authenticated"),
-    ):
-        result = await tool.execute()
-    assert result.startswith("Error:")
+class TestSpotifyToolSchemas:
+    """Test Spotify tool properties and schemas."""
+
+    def test_search_tool(self, search_tool):
+        assert search_tool.name == "spotify_search"
+        assert search_tool.trust_level == "standard"
+        assert "query" in search_tool.parameters["properties"]
+
+    def test_now_playing_tool(self, now_playing_tool):
+        assert now_playing_tool.name == "spotify_now_playing"
+        assert now_playing_tool.trust_level == "standard"
+
+    def test_playback_tool(self, playback_tool):
+        assert playback_tool.name == "spotify_playback"
+        assert "action" in playback_tool.parameters["properties"]
+        assert "action" in playback_tool.parameters["required"]
 
+    def test_playlist_tool(self, playlist_tool):
+        assert playlist_tool.name == "spotify_playlist"
+        assert "action" in playlist_tool.parameters["properties"]
 
-async def test_spotify_playback_invalid_action():
-    from pocketpaw.tools.builtin.spotify import SpotifyPlaybackTool
 
-    tool = SpotifyPlaybackTool()
-    result = await tool.execute(action="dance")
+async def test_spotify_search_no_auth(search_tool, no_auth):
+    result = await search_tool.execute(query="bohemian rhapsody")
     assert result.startswith("Error:")
-    assert "Unknown action" in result
+    assert "authenticated" in result.lower()
 
 
-async def test_spotify_playback_no_auth():
-    from pocketpaw.tools.builtin.spotify import SpotifyPlaybackTool
+async def test_spotify_now_playing_no_auth(now_playing_tool, no_auth):
+    result = await now_playing_tool.execute()
+    assert result.startswith("Error:")
 
-    tool = SpotifyPlaybackTool()
-    with patch(
-        "pocketpaw.integrations.spotify.SpotifyClient._get_token",
-        side_effect=RuntimeError("Not authenticated"),
-    ):
-        result = await tool.execute(action="play")
+
+async def test_spotify_playback_invalid_action(playback_tool):
+    result = await playback_tool.execute(action="dance")
     assert result.startswith("Error:")
+    assert "Unknown action" in result
 
 
-async def test_spotify_playlist_add_missing_args():
-    from pocketpaw.tools.builtin.spotify import SpotifyPlaylistTool
+async def test_spotify_playback_no_auth(playback_tool, no_auth):
+    result = await playback_tool.execute(action="play")
+    assert result.startswith("Error:")
+
 
-    tool = SpotifyPlaylistTool()
+async def test_spotify_playlist_add_missing_args(playlist_tool):
     # Mock _get_token so we get past auth, test arg validation
     with patch(
         "pocketpaw.integrations.spotify.SpotifyClient._get_token",
         new_callable=AsyncMock,
         return_value="fake",
     ):
-        result = await tool.execute(action="add")
+        result = await playlist_tool.execute(action="add")
     assert result.startswith("Error:")
     assert "required" in result.lower()
 
 
-async def test_spotify_search_success():
-    from pocketpaw.tools.builtin.spotify import SpotifySearchTool
-
-    tool = SpotifySearchTool()
-
+async def test_spotify_search_success(search_tool):
     mock_results = [
         {
             "name": "Bohemian Rhapsody",
@@ -125,17 +123,13 @@ async def test_spotify_search_success():
             new_callable=AsyncMock,
             return_value=mock_results,
         ):
-            result = await tool.execute(query="bohemian rhapsody")
+            result = await search_tool.execute(query="bohemian rhapsody")
 
     assert "Bohemian Rhapsody" in result
     assert "Queen" in result
 
 
-async def test_spotify_now_playing_nothing():
-    from pocketpaw.tools.builtin.spotify import SpotifyNowPlayingTool
-
-    tool = SpotifyNowPlayingTool()
-
+async def test_spotify_now_playing_nothing(now_playing_tool):
     with patch(
         "pocketpaw.integrations.spotify.SpotifyClient._get_token",
         new_callable=AsyncMock,
@@ -146,16 +140,12 @@ async def test_spotify_now_playing_nothing():
             new_callable=AsyncMock,
             return_value=None,
         ):
-            result = await tool.execute()
+            result = await now_playing_tool.execute()
 
     assert "Nothing" in result
 
 
-async def test_spotify_playlist_list_success():
-    from pocketpaw.tools.builtin.spotify import SpotifyPlaylistTool
-
-    tool = SpotifyPlaylistTool()
-
+async def test_spotify_playlist_list_success(playlist_tool):
     mock_playlists = [
         {
             "name": "Chill Vibes",
@@ -176,7 +166,7 @@ async def test_spotify_playlist_list_success():
             new_callable=AsyncMock,
             return_value=mock_playlists,
         ):
-            result = await tool.execute(action="list")
+            result = await playlist_tool.execute(action="list")
 
     assert "Chill Vibes" in result
     assert "42 tracks" in result
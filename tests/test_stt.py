@@ -2,39 +2,37 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
+from pocketpaw.tools.builtin.stt import SpeechToTextTool
 
-class TestSpeechToTextToolSchema:
-    """Test SpeechToTextTool properties and schema."""
+_AUDIO_BLOB = bytes(100)  # stand-in audio payload; content is never decoded
 
-    def test_name(self):
-        from pocketpaw.tools.builtin.stt import SpeechToTextTool
 
-        tool = SpeechToTextTool()
-        assert tool.name == "speech_to_text"
+@pytest.fixture
+def stt_tool():
+    return SpeechToTextTool()
 
-    def test_trust_level(self):
-        from pocketpaw.tools.builtin.stt import SpeechToTextTool
 
-        tool = SpeechToTextTool()
-        assert tool.trust_level == "standard"
+class TestSpeechToTextToolSchema:
+    """Test SpeechToTextTool properties and schema."""
 
-    def test_parameters(self):
-        from pocketpaw.tools.builtin.stt import SpeechToTextTool
+    def test_name(self, stt_tool):
+        assert stt_tool.name == "speech_to_text"
 
-        tool = SpeechToTextTool()
-        params = tool.parameters
+    def test_trust_level(self, stt_tool):
+        assert stt_tool.trust_level == "standard"
+
+    def test_parameters(self, stt_tool):
+        params = stt_tool.parameters
         assert "audio_file" in params["properties"]
         assert "language" in params["properties"]
         assert "audio_file" in params["required"]
 
-    def test_description(self):
-        from pocketpaw.tools.builtin.stt import SpeechToTextTool
-
-        tool = SpeechToTextTool()
-        assert "Whisper" in tool.description
-        assert "transcribe" in tool.description.lower()
+    def test_description(self, stt_tool):
+        assert "Whisper" in stt_tool.description
+        assert "transcribe" in stt_tool.description.lower()
 
 
 @pytest.fixture
@@ -47,147 +45,112 @@ def _mock_settings():
         yield settings
 
 
-async def test_stt_no_api_key(tmp_path):
-    from pocketpaw.tools.builtin.stt import SpeechToTextTool
+@pytest.fixture
+def stub_post(monkeypatch):
+    """Swap out httpx.AsyncClient.post; the real client still enters and exits."""
+    post = AsyncMock()
+    monkeypatch.setattr(httpx.AsyncClient, "post", post)
+    return post
+
 
-    tool = SpeechToTextTool()
+async def test_stt_no_api_key(stt_tool, tmp_path):
     audio_file = tmp_path / "test.mp3"
-    audio_file.write_bytes(b"\x00" * 100)
+    audio_file.write_bytes(_AUDIO_BLOB)
     settings = MagicMock()
     settings.openai_api_key = None
     settings.stt_provider = "openai"
     with patch("pocketpaw.tools.builtin.stt.get_settings", return_value=settings):
-        result = await tool.execute(audio_file=str(audio_file))
+        result = await stt_tool.execute(audio_file=str(audio_file))
     assert result.startswith("Error:")
     assert "API key" in result
 
 
-async def test_stt_file_not_found(_mock_settings):
-    from pocketpaw.tools.builtin.stt import SpeechToTextTool
-
-    tool = SpeechToTextTool()
-    result = await tool.execute(audio_file="/nonexistent/audio.mp3")
+async def test_stt_file_not_found(stt_tool, _mock_settings):
+    result = await stt_tool.execute(audio_file="/nonexistent/audio.mp3")
     assert result.startswith("Error:")
     assert "not found" in result
 
 
-async def test_stt_file_too_large(_mock_settings, tmp_path):
-    from pocketpaw.tools.builtin.stt import SpeechToTextTool
-
-    tool = SpeechToTextTool()
+async def test_stt_file_too_large(stt_tool, _mock_settings, tmp_path):
     big_file = tmp_path / "big.mp3"
-    big_file.write_bytes(b"\x00" * (26 * 1024 * 1024))  # 26 MB
-    result = await tool.execute(audio_file=str(big_file))
+    # Sparse 26 MB file: only the logical size matters for the size check.
+    with big_file.open("wb") as f:
+        f.truncate(26 * 1024 * 1024)
+    result = await stt_tool.execute(audio_file=str(big_file))
     assert result.startswith("Error:")
     assert "too large" in result
 
 
-async def test_stt_success(_mock_settings, tmp_path):
-    from pocketpaw.tools.builtin.stt import SpeechToTextTool
-
-    tool = SpeechToTextTool()
+async def test_stt_success(stt_tool, _mock_settings, stub_post, tmp_path):
     audio_file = tmp_path / "test.mp3"
-    audio_file.write_bytes(b"\x00" * 100)
+    audio_file.write_bytes(_AUDIO_BLOB)
 
     mock_resp = MagicMock()
     mock_resp.json.return_value = {"text": "Hello world, this is a test."}
     mock_resp.raise_for_status = MagicMock()
 
-    with patch("httpx.AsyncClient") as mock_client_cls:
-        mock_client = AsyncMock()
-        mock_client.post = AsyncMock(return_value=mock_resp)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-        mock_client_cls.return_value = mock_client
+    stub_post.return_value = mock_resp
 
-        with patch(
-            "pocketpaw.tools.builtin.stt._get_transcripts_dir",
-            return_value=tmp_path,
-        ):
-            result = await tool.execute(audio_file=str(audio_file))
+    with patch(
+        "pocketpaw.tools.builtin.stt._get_transcripts_dir",
+        return_value=tmp_path,
+    ):
+        result = await stt_tool.execute(audio_file=str(audio_file))
 
     assert "Hello world" in result
     assert "Saved to:" in result
 
 
-async def test_stt_with_language(_mock_settings, tmp_path):
-    from pocketpaw.tools.builtin.stt import SpeechToTextTool
-
-    tool = SpeechToTextTool()
+async def test_stt_with_language(stt_tool, _mock_settings, stub_post, tmp_path):
     audio_file = tmp_path / "test.mp3"
-    audio_file.write_bytes(b"\x00" * 100)
+    audio_file.write_bytes(_AUDIO_BLOB)
 
     mock_resp = MagicMock()
     mock_resp.json.return_value = {"text": "Hola mundo"}
     mock_resp.raise_for_status = MagicMock()
 
-    with patch("httpx.AsyncClient") as mock_client_cls:
-        mock_client = AsyncMock()
-        mock_client.post = AsyncMock(return_value=mock_resp)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-        mock_client_cls.return_value = mock_client
+    stub_post.return_value = mock_resp
 
-        with patch(
-            "pocketpaw.tools.builtin.stt._get_transcripts_dir",
-            return_value=tmp_path,
-        ):
-            result = await tool.execute(audio_file=str(audio_file), language="es")
+    with patch(
+        "pocketpaw.tools.builtin.stt._get_transcripts_dir",
+        return_value=tmp_path,
+    ):
+        result = await stt_tool.execute(audio_file=str(audio_file), language="es")
 
     assert "Hola mundo" in result
     # Verify language was passed
-    call_kwargs = mock_client.post.call_args
+    call_kwargs = stub_post.call_args
     assert call_kwargs[1]["data"]["language"] == "es"
 
 
-async def test_stt_empty_transcript(_mock_settings, tmp_path):
-    from pocketpaw.tools.builtin.stt import SpeechToTextTool
-
-    tool = SpeechToTextTool()
+async def test_stt_empty_transcript(stt_tool, _mock_settings, stub_post, tmp_path):
     audio_file = tmp_path / "silence.mp3"
-    audio_file.write_bytes(b"\x00" * 100)
+    audio_file.write_bytes(_AUDIO_BLOB)
 
     mock_resp = MagicMock()
     mock_resp.json.return_value = {"text": ""}
     mock_resp.raise_for_status = MagicMock()
 
-    with patch("httpx.AsyncClient") as mock_client_cls:
-        mock_client = AsyncMock()
-        mock_client.post = AsyncMock(return_value=mock_resp)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-        mock_client_cls.return_value = mock_client
+    stub_post.return_value = mock_resp
 
-        result = await tool.execute(audio_file=str(audio_file))
+    result = await stt_tool.execute(audio_file=str(audio_file))
 
     assert "no speech" in result.lower()
 
 
-async def test_stt_api_error(_mock_settings, tmp_path):
-    from pocketpaw.tools.builtin.stt import SpeechToTextTool
-
-    tool = SpeechToTextTool()
+async def test_stt_api_error(stt_tool, _mock_settings, stub_post, tmp_path):
     audio_file = tmp_path / "test.mp3"
-    audio_file.write_bytes(b"\x00" * 100)
-
-    import httpx as httpx_mod
+    audio_file.write_bytes(_AUDIO_BLOB)
 
     mock_resp = MagicMock()
     mock_resp.status_code = 429
     mock_resp.request = MagicMock()
 
-    with patch("httpx.AsyncClient") as mock_client_cls:
-        mock_client = AsyncMock()
-        mock_client.post = AsyncMock(
-            side_effect=httpx_mod.HTTPStatusError(
-                "rate limited", request=mock_resp.request, response=mock_resp
-            )
-        )
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-        mock_client_cls.return_value = mock_client
-
-        result = await tool.execute(audio_file=str(audio_file))
+    stub_post.side_effect = httpx.HTTPStatusError(
+        "rate limited", request=mock_resp.request, response=mock_resp
+    )
+
+    result = await stt_tool.execute(audio_file=str(audio_file))
 
     assert result.startswith("Error:")
     assert "429" in result
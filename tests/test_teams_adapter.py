@@ -1,24 +1,31 @@
 """Tests for Microsoft Teams Channel Adapter — Sprint 22.
 
-botbuilder-core is mocked since it's an optional dependency.
+botbuilder-core is stubbed in conftest.py since it's an optional dependency.
 """
 
 import sys
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
-# Mock botbuilder before importing the adapter
-mock_bb_core = MagicMock()
-mock_bb_schema = MagicMock()
-mock_bb_aiohttp = MagicMock()
-sys.modules.setdefault("botbuilder", MagicMock())
-sys.modules.setdefault("botbuilder.core", mock_bb_core)
-sys.modules.setdefault("botbuilder.schema", mock_bb_schema)
-sys.modules.setdefault("botbuilder.integration.aiohttp", mock_bb_aiohttp)
+import pytest
 
+from pocketpaw.bus.adapters.teams_adapter import TeamsAdapter
+from pocketpaw.bus.events import Channel, OutboundMessage
 
-from pocketpaw.bus.adapters.teams_adapter import TeamsAdapter  # noqa: E402
-from pocketpaw.bus.events import Channel, OutboundMessage  # noqa: E402
+
+def _activity(**overrides):
+    """Build a Teams message activity, overriding any of the default fields."""
+    fields = {
+        "type": "message",
+        "text": "Hi",
+        "from_property": SimpleNamespace(id="user"),
+        "conversation": SimpleNamespace(id="conv"),
+        "channel_data": None,
+        "id": "act",
+        "service_url": "",
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
 
 
 class TestTeamsAdapterInit:
@@ -41,21 +48,27 @@ class TestTeamsAdapterInit:
         assert adapter.webhook_port == 4000
 
 
+@pytest.fixture(scope="class")
+def activity_types():
+    # Only the conftest stub needs a concrete ActivityTypes.message value;
+    # restored after the class so other tests see the shared stub unchanged.
+    schema = sys.modules["botbuilder.schema"]
+    with pytest.MonkeyPatch.context() as mp:
+        if isinstance(schema, MagicMock):
+            mp.setattr(schema, "ActivityTypes", SimpleNamespace(message="message"))
+        yield
+
+
+@pytest.mark.usefixtures("activity_types")
 class TestTeamsAdapterProcessActivity:
     async def test_process_message(self):
         adapter = TeamsAdapter(app_id="app", app_password="pw")
-        adapter._bus = MagicMock()
-        adapter._bus.publish_inbound = AsyncMock()
+        adapter._bus = SimpleNamespace(publish_inbound=AsyncMock())
 
-        # Mock ActivityTypes
-        mock_bb_schema.ActivityTypes = SimpleNamespace(message="message")
-
-        activity = SimpleNamespace(
-            type="message",
+        activity = _activity(
             text="Hello Teams!",
             from_property=SimpleNamespace(id="user-1"),
             conversation=SimpleNamespace(id="conv-1"),
-            channel_data=None,
             id="act-1",
             service_url="https://smba.trafficmanager.net",
         )
@@ -72,35 +85,18 @@ class TestTeamsAdapterProcessActivity:
 
     async def test_skip_non_message_activity(self):
         adapter = TeamsAdapter(app_id="app", app_password="pw")
-        adapter._bus = MagicMock()
-        adapter._bus.publish_inbound = AsyncMock()
-
-        mock_bb_schema.ActivityTypes = SimpleNamespace(message="message")
+        adapter._bus = SimpleNamespace(publish_inbound=AsyncMock())
 
-        activity = SimpleNamespace(
-            type="typing",  # not a message
-            text="",
-        )
+        activity = _activity(type="typing", text="")  # not a message
         turn_ctx = SimpleNamespace(activity=activity)
         await adapter._process_activity(turn_ctx)
         adapter._bus.publish_inbound.assert_not_called()
 
     async def test_empty_text_skipped(self):
         adapter = TeamsAdapter(app_id="app", app_password="pw")
-        adapter._bus = MagicMock()
-        adapter._bus.publish_inbound = AsyncMock()
-
-        mock_bb_schema.ActivityTypes = SimpleNamespace(message="message")
-
-        activity = SimpleNamespace(
-            type="message",
-            text="",
-            from_property=SimpleNamespace(id="user"),
-            conversation=SimpleNamespace(id="conv"),
-            channel_data=None,
-            id="act",
-            service_url="",
-        )
+        adapter._bus = SimpleNamespace(publish_inbound=AsyncMock())
+
+        activity = _activity(text="")
         turn_ctx = SimpleNamespace(activity=activity)
         await adapter._process_activity(turn_ctx)
         adapter._bus.publish_inbound.assert_not_called()
@@ -111,19 +107,11 @@ class TestTeamsAdapterProcessActivity:
             app_password="pw",
             allowed_tenant_ids=["tenant-ok"],
         )
-        adapter._bus = MagicMock()
-        adapter._bus.publish_inbound = AsyncMock()
-
-        mock_bb_schema.ActivityTypes = SimpleNamespace(message="message")
+        adapter._bus = SimpleNamespace(publish_inbound=AsyncMock())
 
-        activity = SimpleNamespace(
-            type="message",
+        activity = _activity(
             text="blocked",
-            from_property=SimpleNamespace(id="user"),
-            conversation=SimpleNamespace(id="conv"),
             channel_data=SimpleNamespace(tenant={"id": "tenant-bad"}),
-            id="act",
-            service_url="",
         )
         turn_ctx = SimpleNamespace(activity=activity)
         await adapter._process_activity(turn_ctx)
@@ -133,7 +121,7 @@ class TestTeamsAdapterProcessActivity:
 class TestTeamsAdapterSend:
     async def test_send_normal_message(self):
         adapter = TeamsAdapter(app_id="app", app_password="pw")
-        adapter._adapter = MagicMock()  # BotFrameworkAdapter mock
+        adapter._adapter = object()  # BotFrameworkAdapter placeholder (never called)
 
         msg = OutboundMessage(
             channel=Channel.TEAMS,
@@ -145,7 +133,7 @@ class TestTeamsAdapterSend:
 
     async def test_send_stream_accumulates(self):
         adapter = TeamsAdapter(app_id="app", app_password="pw")
-        adapter._adapter = MagicMock()
+        adapter._adapter = object()
 
         chunk1 = OutboundMessage(
             channel=Channel.TEAMS,
@@ -165,7 +153,7 @@ class TestTeamsAdapterSend:
 
     async def test_send_stream_end_flushes(self):
         adapter = TeamsAdapter(app_id="app", app_password="pw")
-        adapter._adapter = MagicMock()
+        adapter._adapter = object()
 
         adapter._buffers["c1"] = "accumulated text"
 
@@ -180,7 +168,7 @@ class TestTeamsAdapterSend:
 
     async def test_send_empty_skipped(self):
         adapter = TeamsAdapter()
-        adapter._adapter = MagicMock()
+        adapter._adapter = object()
 
         msg = OutboundMessage(
             channel=Channel.TEAMS,
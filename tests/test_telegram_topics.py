@@ -1,54 +1,32 @@
 # Tests for Telegram Group Topics support in telegram_adapter.py
 # Created: 2026-02-07
 
-# Mock telegram before importing adapter
-import sys
-from unittest.mock import MagicMock
-
+# python-telegram-bot is stubbed in conftest.py when not installed.
 import pytest
 
-mock_telegram = MagicMock()
-mock_telegram.Update = MagicMock()
-mock_telegram.ForceReply = MagicMock()
-mock_telegram.error = MagicMock()
-sys.modules["telegram"] = mock_telegram
-sys.modules["telegram.constants"] = mock_telegram.constants
-sys.modules["telegram.error"] = mock_telegram.error
-sys.modules["telegram.ext"] = MagicMock()
-
-from pocketpaw.bus.adapters.telegram_adapter import TelegramAdapter  # noqa: E402
-
-
-@pytest.fixture
-def adapter():
-    return TelegramAdapter(token="test-token", allowed_user_id=12345)
-
+from pocketpaw.bus.adapters.telegram_adapter import TelegramAdapter
 
 # ---------------------------------------------------------------------------
 # _parse_chat_id
 # ---------------------------------------------------------------------------
 
 
-class TestParseChatId:
-    def test_plain_chat_id(self):
-        chat_id, topic_id = TelegramAdapter._parse_chat_id("123456")
-        assert chat_id == "123456"
-        assert topic_id is None
-
-    def test_topic_chat_id(self):
-        chat_id, topic_id = TelegramAdapter._parse_chat_id("123456:topic:42")
-        assert chat_id == "123456"
-        assert topic_id == 42
+_PARSE_CASES = [
+    ("123456", "123456", None),
+    ("123456:topic:42", "123456", 42),
+    ("123456:topic:0", "123456", 0),
+    ("-100123456:topic:7", "-100123456", 7),
+]
 
-    def test_topic_id_zero(self):
-        chat_id, topic_id = TelegramAdapter._parse_chat_id("123456:topic:0")
-        assert chat_id == "123456"
-        assert topic_id == 0
 
-    def test_negative_chat_id_with_topic(self):
-        chat_id, topic_id = TelegramAdapter._parse_chat_id("-100123456:topic:7")
-        assert chat_id == "-100123456"
-        assert topic_id == 7
+class TestParseChatId:
+    @pytest.mark.parametrize(
+        ("raw", "chat_id", "topic_id"),
+        _PARSE_CASES,
+        ids=["plain", "topic", "topic_zero", "negative_chat_with_topic"],
+    )
+    def test_parse_chat_id(self, raw, chat_id, topic_id):
+        assert TelegramAdapter._parse_chat_id(raw) == (chat_id, topic_id)
 
 
 # ---------------------------------------------------------------------------
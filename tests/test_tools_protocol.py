@@ -2,7 +2,9 @@
 # Created: 2026-02-02
 
 
-import tempfile
+import asyncio
+import subprocess
+from contextlib import ExitStack
 from pathlib import Path
 from unittest.mock import patch
 
@@ -30,55 +32,52 @@ class MockTool(BaseTool):
         return f"Executed with {param}"
 
 
-class TestToolRegistry:
-    """Tests for ToolRegistry."""
+@pytest.fixture(scope="module")
+def registry_with_mock():
+    registry = ToolRegistry()
+    registry.register(MockTool())
+    return registry
 
-    def test_register_and_get(self):
-        registry = ToolRegistry()
-        tool = MockTool()
-        registry.register(tool)
 
-        assert registry.has("mock_tool")
-        assert registry.get("mock_tool") == tool
-        assert "mock_tool" in registry.tool_names
+@pytest.fixture
+def mutable_registry(registry_with_mock):
+    """The shared registry, with its tool table restored after the test."""
+    snapshot = dict(registry_with_mock._tools)
+    yield registry_with_mock
+    registry_with_mock._tools = snapshot
+
+
+class TestToolRegistry:
+    """Tests for ToolRegistry."""
 
-    def test_unregister(self):
-        registry = ToolRegistry()
-        tool = MockTool()
-        registry.register(tool)
-        registry.unregister("mock_tool")
+    def test_register_and_get(self, registry_with_mock):
+        assert registry_with_mock.has("mock_tool")
+        assert isinstance(registry_with_mock.get("mock_tool"), MockTool)
+        assert "mock_tool" in registry_with_mock.tool_names
 
-        assert not registry.has("mock_tool")
+    def test_unregister(self, mutable_registry):
+        mutable_registry.unregister("mock_tool")
 
-    def test_get_definitions(self):
-        registry = ToolRegistry()
-        tool = MockTool()
-        registry.register(tool)
+        assert not mutable_registry.has("mock_tool")
 
-        defs = registry.get_definitions("openai")
+    def test_get_definitions(self, registry_with_mock):
+        defs = registry_with_mock.get_definitions("openai")
         assert len(defs) == 1
         assert defs[0]["function"]["name"] == "mock_tool"
 
-    @pytest.mark.asyncio
-    async def test_execute(self):
-        registry = ToolRegistry()
-        tool = MockTool()
-        registry.register(tool)
-
-        result = await registry.execute("mock_tool", param="test")
+    async def test_execute(self, registry_with_mock):
+        result = await registry_with_mock.execute("mock_tool", param="test")
         assert result == "Executed with test"
 
-    @pytest.mark.asyncio
-    async def test_execute_missing(self):
-        registry = ToolRegistry()
-        result = await registry.execute("missing_tool")
+    async def test_execute_missing(self, registry_with_mock):
+        result = await registry_with_mock.execute("missing_tool")
         assert "Error: Tool 'missing_tool' not found" in result
 
 
 class TestShellTool:
     """Tests for ShellTool."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_execute_simple(self):
         tool = ShellTool()
         result = (
@@ -88,44 +87,53 @@ class TestShellTool:
         )
         assert "hello" in result
 
-    @pytest.mark.asyncio
     async def test_security_check(self):
         tool = ShellTool()
         result = await tool.execute(command="rm -rf /")
         assert "Dangerous command blocked" in result
 
-    @pytest.mark.asyncio
-    async def test_timeout(self):
-        # Create tool with short timeout
+    async def test_timeout(self, monkeypatch):
+        deadlines = []
+
+        def _expire(cmd, *, timeout, **kwargs):
+            deadlines.append(timeout)
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
+        # No real process: subprocess.run reports the timeout straight away.
+        monkeypatch.setattr("pocketpaw.tools.builtin.shell.subprocess.run", _expire)
         tool = ShellTool(timeout=1)
-        # Sleep for 2 seconds
         result = await tool.execute(command="sleep 2")
-        assert "Command timed out" in result
+        assert "Command timed out after 1s" in result
+        # The deadline handed to subprocess.run is the tool's configured timeout.
+        assert deadlines == [1]
 
 
-@pytest.fixture
-def temp_jail():
-    """Create a temporary directory for file jail."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+_JAIL = Path("/jail")
 
 
-@pytest.fixture
-def mock_settings(temp_jail):
-    """Mock settings with custom file jail."""
-    settings = Settings(file_jail_path=temp_jail)
-    with (
-        patch("pocketpaw.tools.builtin.filesystem.get_settings", return_value=settings),
-        patch("pocketpaw.tools.builtin.shell.get_settings", return_value=settings),
-    ):
+@pytest.fixture(scope="class")
+def jail_settings():
+    """Point the tools' settings at the jail once for the whole class."""
+    settings = Settings(file_jail_path=_JAIL)
+    with ExitStack() as stack:
+        for module in ("filesystem", "shell"):
+            stack.enter_context(
+                patch(f"pocketpaw.tools.builtin.{module}.get_settings", return_value=settings)
+            )
         yield settings
 
 
+@pytest.mark.usefixtures("jail_settings")
 class TestFilesystemTools:
     """Tests for filesystem tools."""
 
-    @pytest.mark.asyncio
-    async def test_write_and_read(self, temp_jail, mock_settings):
+    @pytest.fixture
+    def temp_jail(self, fs):
+        """Create the jail on pyfakefs's in-memory filesystem, fresh for each test."""
+        fs.create_dir(_JAIL)
+        return _JAIL
+
+    async def test_write_and_read(self, temp_jail):
         write_tool = WriteFileTool()
         read_tool = ReadFileTool()
 
@@ -138,8 +146,7 @@ class TestFilesystemTools:
         content = await read_tool.execute(path=file_path)
         assert content == "Hello World"
 
-    @pytest.mark.asyncio
-    async def test_jail_break_attempt(self, temp_jail, mock_settings):
+    async def test_jail_break_attempt(self, temp_jail):
         read_tool = ReadFileTool()
 
         # Try to read outside jail
@@ -156,14 +163,15 @@ class TestFilesystemTools:
         # We want explicit jail error
         assert "Access denied" in result
 
-    @pytest.mark.asyncio
-    async def test_list_dir(self, temp_jail, mock_settings):
+    async def test_list_dir(self, temp_jail):
         list_tool = ListDirTool()
         write_tool = WriteFileTool()
 
         # Create some files
-        await write_tool.execute(path=str(temp_jail / "a.txt"), content="a")
-        await write_tool.execute(path=str(temp_jail / "b.txt"), content="b")
+        await asyncio.gather(
+            write_tool.execute(path=str(temp_jail / "a.txt"), content="a"),
+            write_tool.execute(path=str(temp_jail / "b.txt"), content="b"),
+        )
 
         # List
         result = await list_tool.execute(path=str(temp_jail))
@@ -1,19 +1,34 @@
 # Tests for Feature 2: USER.md user profile in bootstrap
 # Created: 2026-02-06
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
 from pocketpaw.bootstrap.default_provider import DefaultBootstrapProvider
 from pocketpaw.bootstrap.protocol import BootstrapContext
 
+_CHARLIE_PROFILE = "Name: Charlie\nTimezone: UTC+5"
+
+
+@pytest.fixture(scope="class")
+def ro_identity_path(tmp_path_factory):
+    """Freshly bootstrapped identity dir; tests must only read from it."""
+    path = tmp_path_factory.mktemp("identity")
+    DefaultBootstrapProvider(base_path=path)
+    return path
+
+
+@pytest.fixture(scope="class")
+def profiled_provider(tmp_path_factory):
+    """Bootstrapped provider whose USER.md holds a custom profile."""
+    path = tmp_path_factory.mktemp("identity")
+    # Seed USER.md first so the bootstrap doesn't write a default one to replace.
+    (path / "USER.md").write_text(_CHARLIE_PROFILE)
+    return DefaultBootstrapProvider(base_path=path)
+
 
 @pytest.fixture
-def temp_identity_path():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def mutable_identity_path(tmp_path):
+    return tmp_path
 
 
 class TestUserProfile:
@@ -41,41 +56,35 @@ class TestUserProfile:
         assert "Name: Alice" in prompt
         assert "Timezone: PST" in prompt
 
-    async def test_user_md_created_by_default(self, temp_identity_path):
-        DefaultBootstrapProvider(base_path=temp_identity_path)
-        user_file = temp_identity_path / "USER.md"
+    def test_user_md_created_by_default(self, ro_identity_path):
+        user_file = ro_identity_path / "USER.md"
         assert user_file.exists()
         content = user_file.read_text(encoding="utf-8")
         assert "# User Profile" in content
         assert "Name:" in content
         assert "Timezone:" in content
 
-    async def test_user_md_not_overwritten(self, temp_identity_path):
+    async def test_user_md_not_overwritten(self, mutable_identity_path):
         # Pre-create USER.md with custom content
-        (temp_identity_path / "USER.md").write_text("Name: Bob")
-        DefaultBootstrapProvider(base_path=temp_identity_path)
-        content = (temp_identity_path / "USER.md").read_text(encoding="utf-8")
+        (mutable_identity_path / "USER.md").write_text("Name: Bob")
+        DefaultBootstrapProvider(base_path=mutable_identity_path)
+        content = (mutable_identity_path / "USER.md").read_text(encoding="utf-8")
         assert content == "Name: Bob"
 
-    async def test_user_profile_loaded_into_context(self, temp_identity_path):
-        provider = DefaultBootstrapProvider(base_path=temp_identity_path)
-        # Overwrite with custom profile
-        (temp_identity_path / "USER.md").write_text("Name: Charlie\nTimezone: UTC+5")
-        ctx = await provider.get_context()
-        assert ctx.user_profile == "Name: Charlie\nTimezone: UTC+5"
+    async def test_user_profile_loaded_into_context(self, profiled_provider):
+        ctx = await profiled_provider.get_context()
+        assert ctx.user_profile == _CHARLIE_PROFILE
 
-    async def test_user_profile_in_system_prompt(self, temp_identity_path):
-        provider = DefaultBootstrapProvider(base_path=temp_identity_path)
-        (temp_identity_path / "USER.md").write_text("Name: Charlie")
-        ctx = await provider.get_context()
+    async def test_user_profile_in_system_prompt(self, profiled_provider):
+        ctx = await profiled_provider.get_context()
         prompt = ctx.to_system_prompt()
         assert "# User Profile" in prompt
         assert "Name: Charlie" in prompt
 
-    async def test_missing_user_md_no_error(self, temp_identity_path):
-        provider = DefaultBootstrapProvider(base_path=temp_identity_path)
+    async def test_missing_user_md_no_error(self, mutable_identity_path):
+        provider = DefaultBootstrapProvider(base_path=mutable_identity_path)
         # Delete the USER.md that was created by default
-        (temp_identity_path / "USER.md").unlink()
+        (mutable_identity_path / "USER.md").unlink()
         ctx = await provider.get_context()
         assert ctx.user_profile == ""
         prompt = ctx.to_system_prompt()
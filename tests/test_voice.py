@@ -1,7 +1,9 @@
 # Tests for tools/builtin/voice.py
 # Created: 2026-02-07
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+
+import pytest
 
 from pocketpaw.tools.builtin.voice import TextToSpeechTool, _get_audio_dir
 
@@ -31,42 +33,23 @@ class TestToolDefinition:
 # ---------------------------------------------------------------------------
 
 
-async def test_openai_no_key():
-    tool = TextToSpeechTool()
-    mock_settings = MagicMock()
-    mock_settings.tts_provider = "openai"
-    mock_settings.tts_voice = "alloy"
-    mock_settings.openai_api_key = None
-
-    with patch("pocketpaw.tools.builtin.voice.get_settings", return_value=mock_settings):
-        result = await tool.execute(text="Hello world")
-        assert "Error" in result
-        assert "OpenAI" in result
-
-
-async def test_elevenlabs_no_key():
-    tool = TextToSpeechTool()
-    mock_settings = MagicMock()
-    mock_settings.tts_provider = "elevenlabs"
-    mock_settings.tts_voice = "test-voice-id"
-    mock_settings.elevenlabs_api_key = None
-
-    with patch("pocketpaw.tools.builtin.voice.get_settings", return_value=mock_settings):
-        result = await tool.execute(text="Hello world")
-        assert "Error" in result
-        assert "ElevenLabs" in result
-
-
-async def test_unknown_provider():
-    tool = TextToSpeechTool()
-    mock_settings = MagicMock()
-    mock_settings.tts_provider = "unknown"
-    mock_settings.tts_voice = "x"
-
-    with patch("pocketpaw.tools.builtin.voice.get_settings", return_value=mock_settings):
-        result = await tool.execute(text="Hello")
-        assert "Error" in result
-        assert "Unknown TTS provider" in result
+@pytest.mark.parametrize(
+    ("provider", "voice", "key_attr", "needle"),
+    [
+        ("openai", "alloy", "openai_api_key", "OpenAI"),
+        ("elevenlabs", "test-voice-id", "elevenlabs_api_key", "ElevenLabs"),
+        ("unknown", "x", None, "Unknown TTS provider"),
+    ],
+    ids=["openai_no_key", "elevenlabs_no_key", "unknown_provider"],
+)
+async def test_missing_key_or_unknown_provider(provider, voice, key_attr, needle, monkeypatch):
+    missing_key = {key_attr: None} if key_attr else {}
+    mock_settings = SimpleNamespace(tts_provider=provider, tts_voice=voice, **missing_key)
+    monkeypatch.setattr("pocketpaw.tools.builtin.voice.get_settings", lambda: mock_settings)
+
+    result = await TextToSpeechTool().execute(text="Hello world")
+    assert "Error" in result
+    assert needle in result
 
 
 # ---------------------------------------------------------------------------
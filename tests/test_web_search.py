@@ -1,17 +1,70 @@
 # Tests for Feature 1: WebSearchTool
 # Created: 2026-02-06
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import json
+from dataclasses import dataclass
+from unittest.mock import MagicMock
 
 import httpx
 import pytest
 
+from pocketpaw.tools.builtin import web_search
 from pocketpaw.tools.builtin.web_search import WebSearchTool
 
+_TAVILY_HOST = "api.tavily.com"
+_BRAVE_HOST = "api.search.brave.com"
+_PARALLEL_HOST = "api.parallel.ai"
+
+
+class _SearchApi:
+    """httpx.MockTransport handler that answers per host and records requests.
+
+    ``replies`` maps a host to either a JSON body (served with a 200) or a
+    callable taking the request and returning an ``httpx.Response``.
+    """
+
+    def __init__(self):
+        self.replies = {}
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        reply = self.replies[request.url.host]
+        if callable(reply):
+            return reply(request)
+        return httpx.Response(200, json=reply)
+
+
+@dataclass
+class _SearchSettings:
+    """The slice of Settings that WebSearchTool reads."""
+
+    web_search_provider: str = "tavily"
+    tavily_api_key: str | None = None
+    brave_search_api_key: str | None = None
+    parallel_api_key: str | None = None
+
+
+@pytest.fixture
+def search_settings(monkeypatch):
+    """Install a _SearchSettings built from the given fields as get_settings()."""
+
+    def install(**fields):
+        settings = _SearchSettings(**fields)
+        monkeypatch.setattr("pocketpaw.tools.builtin.web_search.get_settings", lambda: settings)
+        return settings
+
+    return install
+
+
+@pytest.fixture
+def search_api():
+    return _SearchApi()
+
 
 @pytest.fixture
-def tool():
-    return WebSearchTool()
+def tool(search_api):
+    return WebSearchTool(transport=httpx.MockTransport(search_api))
 
 
 class TestWebSearchTool:
@@ -28,76 +81,78 @@ class TestWebSearchTool:
         assert "query" in params["properties"]
         assert "num_results" in params["properties"]
         assert "query" in params["required"]
-
-    @patch("pocketpaw.tools.builtin.web_search.get_settings")
-    async def test_tavily_search_success(self, mock_settings, tool):
-        mock_settings.return_value = MagicMock(
-            web_search_provider="tavily",
-            tavily_api_key="test-key",
-        )
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.raise_for_status = MagicMock()
-        mock_resp.json.return_value = {
-            "results": [
+        assert params["properties"]["num_results"]["minimum"] == 1
+        assert params["properties"]["num_results"]["maximum"] == 10
+
+    @pytest.mark.parametrize(
+        ("provider", "settings_kwargs", "host", "reply", "expected"),
+        [
+            pytest.param(
+                "tavily",
+                {"tavily_api_key": "test-key"},
+                _TAVILY_HOST,
                 {
-                    "title": "Python Docs",
-                    "url": "https://docs.python.org",
-                    "content": "Official Python documentation",
-                }
-            ]
-        }
-
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.return_value = mock_resp
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
-
-            result = await tool.execute(query="python docs")
-
-        assert "Python Docs" in result
-        assert "https://docs.python.org" in result
-
-    @patch("pocketpaw.tools.builtin.web_search.get_settings")
-    async def test_brave_search_success(self, mock_settings, tool):
-        mock_settings.return_value = MagicMock(
-            web_search_provider="brave",
-            brave_search_api_key="test-brave-key",
-        )
-
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.raise_for_status = MagicMock()
-        mock_resp.json.return_value = {
-            "web": {
-                "results": [
-                    {
-                        "title": "Brave Search",
-                        "url": "https://brave.com",
-                        "description": "Privacy search engine",
+                    "results": [
+                        {
+                            "title": "Python Docs",
+                            "url": "https://docs.python.org",
+                            "content": "Official Python documentation",
+                        }
+                    ]
+                },
+                ["Python Docs", "https://docs.python.org"],
+                id="tavily",
+            ),
+            pytest.param(
+                "brave",
+                {"brave_search_api_key": "test-brave-key"},
+                _BRAVE_HOST,
+                {
+                    "web": {
+                        "results": [
+                            {
+                                "title": "Brave Search",
+                                "url": "https://brave.com",
+                                "description": "Privacy search engine",
+                            }
+                        ]
                     }
-                ]
-            }
-        }
-
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.get.return_value = mock_resp
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
-
-            result = await tool.execute(query="brave search")
-
-        assert "Brave Search" in result
-        assert "https://brave.com" in result
-
-    @patch("pocketpaw.tools.builtin.web_search.get_settings")
-    async def test_missing_tavily_api_key(self, mock_settings, tool):
-        mock_settings.return_value = MagicMock(
+                },
+                ["Brave Search", "https://brave.com", "Privacy search engine"],
+                id="brave",
+            ),
+            pytest.param(
+                "parallel",
+                {"parallel_api_key": "test-parallel-key"},
+                _PARALLEL_HOST,
+                {
+                    "results": [
+                        {
+                            "title": "Parallel AI Docs",
+                            "url": "https://docs.parallel.ai",
+                            "excerpts": ["First excerpt.", "Second excerpt."],
+                        }
+                    ]
+                },
+                ["Parallel AI Docs", "https://docs.parallel.ai", "First excerpt. Second excerpt."],
+                id="parallel",
+            ),
+        ],
+    )
+    async def test_provider_search_success(
+        self, search_settings, tool, search_api, provider, settings_kwargs, host, reply, expected
+    ):
+        search_settings(web_search_provider=provider, **settings_kwargs)
+        search_api.replies[host] = reply
+
+        result = await tool.execute(query="docs")
+
+        for needle in expected:
+            assert needle in result
+        assert [r.url.host for r in search_api.requests] == [host]
+
+    async def test_missing_tavily_api_key(self, search_settings, tool):
+        search_settings(
             web_search_provider="tavily",
             tavily_api_key=None,
         )
@@ -105,9 +160,8 @@ class TestWebSearchTool:
         assert "Error" in result
         assert "Tavily API key" in result
 
-    @patch("pocketpaw.tools.builtin.web_search.get_settings")
-    async def test_missing_brave_api_key(self, mock_settings, tool):
-        mock_settings.return_value = MagicMock(
+    async def test_missing_brave_api_key(self, search_settings, tool):
+        search_settings(
             web_search_provider="brave",
             brave_search_api_key=None,
         )
@@ -115,100 +169,50 @@ class TestWebSearchTool:
         assert "Error" in result
         assert "Brave Search API key" in result
 
-    @patch("pocketpaw.tools.builtin.web_search.get_settings")
-    async def test_unknown_provider(self, mock_settings, tool):
-        mock_settings.return_value = MagicMock(web_search_provider="duckduckgo")
+    async def test_unknown_provider(self, search_settings, tool):
+        search_settings(web_search_provider="duckduckgo")
         result = await tool.execute(query="test")
         assert "Error" in result
         assert "Unknown search provider" in result
 
-    @patch("pocketpaw.tools.builtin.web_search.get_settings")
-    async def test_no_results(self, mock_settings, tool):
-        mock_settings.return_value = MagicMock(
+    async def test_no_results(self, search_settings, tool, search_api):
+        search_settings(
             web_search_provider="tavily",
             tavily_api_key="test-key",
         )
+        search_api.replies[_TAVILY_HOST] = {"results": []}
 
-        mock_resp = MagicMock()
-        mock_resp.raise_for_status = MagicMock()
-        mock_resp.json.return_value = {"results": []}
-
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.return_value = mock_resp
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
-
-            result = await tool.execute(query="xyznonexistent")
+        result = await tool.execute(query="xyznonexistent")
 
         assert "No results found" in result
 
-    @patch("pocketpaw.tools.builtin.web_search.get_settings")
-    async def test_http_error(self, mock_settings, tool):
-        mock_settings.return_value = MagicMock(
+    async def test_http_error(self, search_settings, tool, search_api):
+        search_settings(
             web_search_provider="tavily",
             tavily_api_key="test-key",
         )
+        search_api.replies[_TAVILY_HOST] = lambda request: httpx.Response(401)
 
-        mock_resp = MagicMock()
-        mock_resp.status_code = 401
-        mock_resp.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Unauthorized",
-            request=MagicMock(),
-            response=MagicMock(status_code=401),
-        )
-
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.return_value = mock_resp
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
-
-            result = await tool.execute(query="test")
+        result = await tool.execute(query="test")
 
         assert "Error" in result
+        assert "401" in result
 
-    @patch("pocketpaw.tools.builtin.web_search.get_settings")
-    async def test_parallel_search_success(self, mock_settings, tool):
-        mock_settings.return_value = MagicMock(
+    async def test_parallel_sends_auth_headers(self, search_settings, tool, search_api):
+        search_settings(
             web_search_provider="parallel",
             parallel_api_key="test-parallel-key",
         )
+        search_api.replies[_PARALLEL_HOST] = {"results": []}
 
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.raise_for_status = MagicMock()
-        mock_resp.json.return_value = {
-            "results": [
-                {
-                    "title": "Parallel AI Docs",
-                    "url": "https://docs.parallel.ai",
-                    "excerpts": ["First excerpt.", "Second excerpt."],
-                }
-            ]
-        }
-
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.return_value = mock_resp
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
-
-            result = await tool.execute(query="parallel ai")
-
-        assert "Parallel AI Docs" in result
-        assert "https://docs.parallel.ai" in result
-        # Verify headers were sent correctly
-        call_kwargs = mock_client.post.call_args
-        assert call_kwargs.kwargs["headers"]["x-api-key"] == "test-parallel-key"
-        assert "parallel-beta" in call_kwargs.kwargs["headers"]
-
-    @patch("pocketpaw.tools.builtin.web_search.get_settings")
-    async def test_parallel_missing_api_key(self, mock_settings, tool):
-        mock_settings.return_value = MagicMock(
+        await tool.execute(query="parallel ai")
+
+        headers = search_api.requests[0].headers
+        assert headers["x-api-key"] == "test-parallel-key"
+        assert "parallel-beta" in headers
+
+    async def test_parallel_missing_api_key(self, search_settings, tool):
+        search_settings(
             web_search_provider="parallel",
             parallel_api_key=None,
         )
@@ -216,47 +220,145 @@ class TestWebSearchTool:
         assert "Error" in result
         assert "Parallel AI API key" in result
 
-    @patch("pocketpaw.tools.builtin.web_search.get_settings")
-    async def test_parallel_no_results(self, mock_settings, tool):
-        mock_settings.return_value = MagicMock(
+    async def test_parallel_no_results(self, search_settings, tool, search_api):
+        search_settings(
             web_search_provider="parallel",
             parallel_api_key="test-key",
         )
+        search_api.replies[_PARALLEL_HOST] = {"results": []}
 
-        mock_resp = MagicMock()
-        mock_resp.raise_for_status = MagicMock()
-        mock_resp.json.return_value = {"results": []}
+        result = await tool.execute(query="nothing here")
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.return_value = mock_resp
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        assert "No results found" in result
 
-            result = await tool.execute(query="nothing here")
+    async def test_num_results_clamped(self, search_settings, tool, search_api):
+        search_settings(
+            web_search_provider="tavily",
+            tavily_api_key="test-key",
+        )
+        search_api.replies[_TAVILY_HOST] = {"results": [{"title": "A", "url": "u", "content": "c"}]}
 
-        assert "No results found" in result
+        # num_results=50 should be clamped to 10
+        result = await tool.execute(query="test", num_results=50)
+
+        assert "A" in result
+        assert json.loads(search_api.requests[0].content)["max_results"] == 10
 
-    @patch("pocketpaw.tools.builtin.web_search.get_settings")
-    async def test_num_results_clamped(self, mock_settings, tool):
-        mock_settings.return_value = MagicMock(
+    async def test_execute_many_fans_out(self, search_settings, tool, search_api):
+        search_settings(
             web_search_provider="tavily",
             tavily_api_key="test-key",
         )
 
-        mock_resp = MagicMock()
-        mock_resp.raise_for_status = MagicMock()
-        mock_resp.json.return_value = {"results": [{"title": "A", "url": "u", "content": "c"}]}
+        def echo_query(request):
+            query = json.loads(request.content)["query"]
+            return httpx.Response(200, json={"results": [{"title": query, "url": "u"}]})
 
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post.return_value = mock_resp
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        search_api.replies[_TAVILY_HOST] = echo_query
+        queries = [f"query {i}" for i in range(10)]
 
-            # num_results=50 should be clamped to 10
-            result = await tool.execute(query="test", num_results=50)
+        results = await tool.execute_many(queries)
 
-        assert "A" in result
+        assert len(search_api.requests) == 10
+        for query, result in zip(queries, results, strict=True):
+            assert f"**{query}**" in result
+
+    async def test_cache_hit_skips_http(self, search_settings, tool, search_api):
+        search_settings(
+            web_search_provider="tavily",
+            tavily_api_key="test-key",
+        )
+        search_api.replies[_TAVILY_HOST] = {"results": [{"title": "A", "url": "u", "content": "c"}]}
+
+        first = await tool.execute(query="Cached Query")
+        second = await tool.execute(query="  Cached Query ")
+
+        assert second == first
+        assert len(search_api.requests) == 1
+        assert json.loads(search_api.requests[0].content)["query"] == "Cached Query"
+
+        # Case is significant: a differently-cased query is searched afresh.
+        await tool.execute(query="cached query")
+        assert len(search_api.requests) == 2
+
+        tool.invalidate()
+        await tool.execute(query="Cached Query")
+        assert len(search_api.requests) == 3
+
+    async def test_errors_not_cached(self, search_settings, tool, search_api):
+        search_settings(
+            web_search_provider="tavily",
+            tavily_api_key="test-key",
+        )
+
+        def refuse(request):
+            raise httpx.ConnectError("down", request=request)
+
+        search_api.replies[_TAVILY_HOST] = refuse
+
+        await tool.execute(query="flaky")
+        await tool.execute(query="flaky")
+
+        assert len(search_api.requests) == 2
+
+    async def test_client_reused_across_searches(self, tool):
+        client = await tool._get_client()
+        assert await tool._get_client() is client
+
+        await tool.close()
+        assert client.is_closed
+        assert tool._client is None
+
+    def test_format_results_layout(self):
+        results = [
+            {"title": "First", "url": "https://a.example", "content": "x" * 300},
+            {"url": "https://b.example"},
+        ]
+
+        text = WebSearchTool._format_results("q", results)
+
+        assert text == (
+            "Search results for: q\n\n"
+            f"1. **First**\n   https://a.example\n   {'x' * 200}\n\n"
+            "2. **Untitled**\n   https://b.example\n   \n"
+        )
+
+
+async def test_client_uses_http2(monkeypatch):
+    client_cls = MagicMock()
+    monkeypatch.setattr(web_search.httpx, "AsyncClient", client_cls)
+
+    await WebSearchTool()._get_client()
+
+    assert client_cls.call_args.kwargs["http2"] is True
+
+
+async def test_shared_tool_reused_and_closed(monkeypatch):
+    monkeypatch.setattr(web_search, "_shared_tool", None)
+    await web_search.close_web_search_tool()  # nothing opened yet: no-op
+
+    shared = web_search.get_web_search_tool()
+    assert web_search.get_web_search_tool() is shared
+
+    client = await shared._get_client()
+    await web_search.close_web_search_tool()
+    assert client.is_closed
+
+
+async def test_cli_run_closes_shared_client(monkeypatch):
+    from pocketpaw.tools import cli
+
+    closed = []
+
+    async def fake_close():
+        closed.append(True)
+
+    class FailingTool:
+        async def execute(self, **kwargs):
+            raise RuntimeError("boom")
+
+    monkeypatch.setattr(cli, "close_web_search_tool", fake_close)
+
+    with pytest.raises(RuntimeError):
+        await cli._run(FailingTool(), {})
+    assert closed == [True]
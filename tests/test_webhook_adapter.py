@@ -4,6 +4,8 @@ Created: 2026-02-09
 """
 
 import asyncio
+import hashlib
+import hmac
 import json
 from unittest.mock import AsyncMock, MagicMock
 
@@ -22,6 +24,14 @@ def adapter():
     return a
 
 
+@pytest.fixture
+def published(adapter):
+    """Event set once handle_webhook() publishes, i.e. after any sync future is registered."""
+    event = asyncio.Event()
+    adapter._bus.publish_inbound.side_effect = lambda msg: event.set()
+    return event
+
+
 @pytest.fixture
 def slot():
     return WebhookSlotConfig(
@@ -45,6 +55,13 @@ class TestWebhookSlotConfig:
         assert cfg.description == "GitHub"
         assert cfg.sync_timeout == 10
 
+    def test_sign_matches_hmac_sha256(self):
+        cfg = WebhookSlotConfig(name="gh", secret="sec")
+        body = b'{"content": "hello"}'
+        expected = hmac.new(b"sec", body, hashlib.sha256).hexdigest()
+
+        assert cfg.sign(body) == expected
+
 
 class TestWebhookAdapterProperties:
     def test_channel_is_webhook(self):
@@ -105,11 +122,11 @@ class TestHandleWebhookAsync:
 
 
 class TestHandleWebhookSync:
-    async def test_sync_resolves_with_response(self, adapter, slot):
+    async def test_sync_resolves_with_response(self, adapter, slot, published):
         """Sync mode resolves when send() delivers a non-streaming message."""
 
         async def respond():
-            await asyncio.sleep(0.05)
+            await published.wait()
             out = OutboundMessage(
                 channel=Channel.WEBHOOK,
                 chat_id="req-sync-1",
@@ -127,14 +144,36 @@ class TestHandleWebhookSync:
         slot.sync_timeout = 0.1  # 100ms
         result = await adapter.handle_webhook(slot, {"content": "hi"}, "req-timeout", sync=True)
         assert result is None
-        # Pending should be cleaned up
+        # Pending future and any partial stream buffer should be cleaned up
         assert "req-timeout" not in adapter._pending
+        assert "req-timeout" not in adapter._buffers
+
+    async def test_sync_timeout_drops_partial_stream(self, adapter, slot, published):
+        slot.sync_timeout = 0.1
+
+        async def partial_stream():
+            await published.wait()
+            chunk = OutboundMessage(
+                channel=Channel.WEBHOOK,
+                chat_id="req-partial",
+                content="half",
+                is_stream_chunk=True,
+            )
+            await adapter.send(chunk)
+
+        asyncio.create_task(partial_stream())
+
+        result = await adapter.handle_webhook(slot, {"content": "hi"}, "req-partial", sync=True)
+
+        assert result is None
+        assert adapter._pending == {}
+        assert adapter._buffers == {}
 
-    async def test_sync_stream_accumulation(self, adapter, slot):
+    async def test_sync_stream_accumulation(self, adapter, slot, published):
         """Sync mode accumulates stream chunks and resolves on stream_end."""
 
         async def stream_respond():
-            await asyncio.sleep(0.05)
+            await published.wait()
             # Send chunks
             for chunk in ["Hello ", "world", "!"]:
                 out = OutboundMessage(
@@ -211,3 +250,32 @@ class TestSendMethod:
         assert fut.done()
         assert fut.result() == "AB"
         assert "req-s" not in adapter._buffers
+
+    async def test_long_stream_joined_once(self, adapter):
+        """Chunks are buffered in a list and joined once at stream end."""
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        adapter._pending["req-long"] = fut
+        chunks = [
+            OutboundMessage(
+                channel=Channel.WEBHOOK,
+                chat_id="req-long",
+                content="x",
+                is_stream_chunk=True,
+            )
+            for _ in range(10_000)
+        ]
+        end = OutboundMessage(
+            channel=Channel.WEBHOOK,
+            chat_id="req-long",
+            content="",
+            is_stream_chunk=True,
+            is_stream_end=True,
+        )
+
+        for out in chunks:
+            await adapter.send(out)
+        assert len(adapter._buffers["req-long"]) == 10_000
+        await adapter.send(end)
+
+        assert fut.result() == "x" * 10_000
@@ -9,9 +9,12 @@ import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from fastapi import Request
 from fastapi.testclient import TestClient
 
-from pocketpaw.dashboard import _channel_adapters, app
+from pocketpaw.config import Settings
+from pocketpaw.dashboard import app
+from pocketpaw.dashboard_channels import get_webhook_adapter
 
 # ---------- fixtures ----------
 
@@ -28,14 +31,17 @@ _TEST_TOKEN = "test-dashboard-token-12345"
 @pytest.fixture(autouse=True)
 def _mock_settings():
     """Patch Settings.load() to return a Settings with one webhook config."""
-    with patch("pocketpaw.dashboard_channels.Settings") as MockSettings:
-        mock_instance = MagicMock()
-        mock_instance.webhook_configs = [_TEST_SLOT.copy()]
-        mock_instance.webhook_sync_timeout = 30
-        mock_instance.web_port = 8888
-        mock_instance.save = MagicMock()
-        MockSettings.load.return_value = mock_instance
-        yield mock_instance
+    with (
+        patch("pocketpaw.dashboard_channels.Settings") as MockSettings,
+        patch.object(Settings, "save"),
+    ):
+        settings = Settings.model_construct(
+            webhook_configs=[_TEST_SLOT.copy()],
+            webhook_sync_timeout=30,
+            web_port=8888,
+        )
+        MockSettings.load.return_value = settings
+        yield settings
 
 
 @pytest.fixture(autouse=True)
@@ -45,9 +51,17 @@ def _mock_token():
         yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    return TestClient(app, raise_server_exceptions=False)
+    """One TestClient (and its connection pool) shared by every test.
+
+    Not entered as a context manager: the dashboard's startup hook boots the
+    agent loop and channel adapters, which these route tests never need.
+    The per-test patches above stay function-scoped, so state still resets.
+    """
+    client = TestClient(app, raise_server_exceptions=False)
+    yield client
+    client.close()
 
 
 def _auth_headers(**extra):
@@ -59,12 +73,12 @@ def _auth_headers(**extra):
 
 @pytest.fixture(autouse=True)
 def _mock_adapter():
-    """Ensure a mock webhook adapter is in _channel_adapters."""
+    """Serve a mock webhook adapter through the route's dependency."""
     mock_adapter = MagicMock()
     mock_adapter.handle_webhook = AsyncMock(return_value=None)
-    _channel_adapters["webhook"] = mock_adapter
+    app.dependency_overrides[get_webhook_adapter] = lambda: mock_adapter
     yield mock_adapter
-    _channel_adapters.pop("webhook", None)
+    app.dependency_overrides.pop(get_webhook_adapter, None)
 
 
 # ---------- auth tests ----------
@@ -111,6 +125,32 @@ class TestWebhookAuth:
         assert resp.status_code == 200
         assert resp.json()["status"] == "accepted"
 
+    def test_body_read_once(self, client, _mock_adapter, monkeypatch):
+        """The raw body is read once and reused for both HMAC and JSON parsing."""
+        reads = []
+        original_body = Request.body
+
+        async def counting_body(self):
+            reads.append(self.url.path)
+            return await original_body(self)
+
+        monkeypatch.setattr(Request, "body", counting_body)
+        body = json.dumps({"content": "hello"}).encode()
+        sig = hmac.new(b"supersecret", body, hashlib.sha256).hexdigest()
+
+        resp = client.post(
+            "/webhook/inbound/test-hook",
+            content=body,
+            headers={
+                "X-Webhook-Signature": f"sha256={sig}",
+                "Content-Type": "application/json",
+            },
+        )
+
+        assert resp.status_code == 200
+        assert reads == ["/webhook/inbound/test-hook"]
+        assert _mock_adapter.handle_webhook.call_args[0][1] == {"content": "hello"}
+
     def test_hmac_signature_invalid(self, client):
         body = json.dumps({"content": "hello"}).encode()
 
@@ -134,6 +174,15 @@ class TestWebhookInbound:
         )
         assert resp.status_code == 404
 
+    def test_invalid_json_400(self, client, _mock_adapter):
+        resp = client.post(
+            "/webhook/inbound/test-hook",
+            content=b"{not json",
+            headers={"X-Webhook-Secret": "supersecret", "Content-Type": "application/json"},
+        )
+        assert resp.status_code == 400
+        _mock_adapter.handle_webhook.assert_not_called()
+
     def test_async_mode(self, client, _mock_adapter):
         resp = client.post(
             "/webhook/inbound/test-hook",
@@ -146,6 +195,29 @@ class TestWebhookInbound:
         assert "request_id" in data
         _mock_adapter.handle_webhook.assert_called_once()
 
+    def test_adapter_started_on_demand(self, client, monkeypatch):
+        """With no running adapter, the route starts one before dispatching."""
+        started = MagicMock()
+        started.handle_webhook = AsyncMock(return_value=None)
+        adapters = {}
+
+        async def fake_start(channel, settings):
+            adapters[channel] = started
+            return True
+
+        monkeypatch.setattr("pocketpaw.dashboard_channels._channel_adapters", adapters)
+        monkeypatch.setattr("pocketpaw.dashboard_channels._start_channel_adapter", fake_start)
+        monkeypatch.setitem(app.dependency_overrides, get_webhook_adapter, lambda: None)
+
+        resp = client.post(
+            "/webhook/inbound/test-hook",
+            json={"content": "hello"},
+            headers={"X-Webhook-Secret": "supersecret"},
+        )
+
+        assert resp.status_code == 200
+        started.handle_webhook.assert_awaited_once()
+
     def test_sync_mode_timeout(self, client, _mock_adapter):
         """Sync mode returns timeout when adapter returns None."""
         _mock_adapter.handle_webhook = AsyncMock(return_value=None)
@@ -174,6 +246,60 @@ class TestWebhookInbound:
         assert data["response"] == "Agent says hi"
 
 
+class TestWebhookBatch:
+    def test_batch_accepted(self, client, _mock_adapter):
+        resp = client.post(
+            "/webhook/inbound/test-hook/batch",
+            json=[{"content": "a"}, {"content": "b"}],
+            headers={"X-Webhook-Secret": "supersecret"},
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["status"] == "accepted"
+        assert len(set(data["request_ids"])) == 2
+        assert _mock_adapter.handle_webhook.await_count == 2
+        bodies = [c.args[1] for c in _mock_adapter.handle_webhook.await_args_list]
+        assert bodies == [{"content": "a"}, {"content": "b"}]
+
+    def test_batch_hmac_over_whole_array(self, client, _mock_adapter):
+        body = json.dumps([{"content": "a"}, {"content": "b"}]).encode()
+        sig = hmac.new(b"supersecret", body, hashlib.sha256).hexdigest()
+
+        resp = client.post(
+            "/webhook/inbound/test-hook/batch",
+            content=body,
+            headers={
+                "X-Webhook-Signature": f"sha256={sig}",
+                "Content-Type": "application/json",
+            },
+        )
+        assert resp.status_code == 200
+        assert _mock_adapter.handle_webhook.await_count == 2
+
+    def test_batch_requires_auth(self, client, _mock_adapter):
+        resp = client.post(
+            "/webhook/inbound/test-hook/batch",
+            json=[{"content": "a"}],
+            headers={"X-Webhook-Secret": "wrongsecret"},
+        )
+        assert resp.status_code == 403
+        _mock_adapter.handle_webhook.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "payload",
+        [{"content": "not a list"}, [{"content": "a"}, "b"], [{}] * 101],
+        ids=["object", "non_object_item", "too_many"],
+    )
+    def test_batch_rejects_bad_body(self, client, _mock_adapter, payload):
+        resp = client.post(
+            "/webhook/inbound/test-hook/batch",
+            json=payload,
+            headers={"X-Webhook-Secret": "supersecret"},
+        )
+        assert resp.status_code == 400
+        _mock_adapter.handle_webhook.assert_not_called()
+
+
 class TestWebhookCRUD:
     def test_list_webhooks(self, client):
         resp = client.get("/api/webhooks", headers=_auth_headers())
@@ -196,6 +322,21 @@ class TestWebhookCRUD:
         assert len(data["webhook"]["secret"]) > 10
         _mock_settings.save.assert_called()
 
+    def test_added_webhook_reachable(self, client, _mock_settings):
+        """A slot added through the API is immediately reachable by the inbound route."""
+        assert _mock_settings.webhook_config("new-hook") is None
+
+        added = client.post(
+            "/api/webhooks/add", json={"name": "new-hook"}, headers=_auth_headers()
+        ).json()["webhook"]
+        resp = client.post(
+            "/webhook/inbound/new-hook",
+            json={"content": "hello"},
+            headers={"X-Webhook-Secret": added["secret"]},
+        )
+
+        assert resp.status_code == 200
+
     def test_add_webhook_duplicate(self, client):
         resp = client.post(
             "/api/webhooks/add",